@@ -1,9 +1,14 @@
-import configparser
-from typing import Any
-from dataclasses import dataclass, is_dataclass, fields
-from pathlib import Path
+from __future__ import annotations
+import functools
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass, replace
+from operator import attrgetter
+from typing import Any, Callable
 
-from utils import write_debug_log, GetString, default_get_string_fallback
+from utils import write_debug_log, is_debug_log_enabled, GetString, default_get_string_fallback
 
 _get_string: GetString = default_get_string_fallback
 
@@ -12,42 +17,42 @@ def set_get_string_func(func: GetString):
     _get_string = func
 
 # --- AppSettings Models (from settings_model.py) ---
-@dataclass
+@dataclass(slots=True)
 class Paths:
     input_dir: str
     model_dir: str
     model_filename: str
 
-@dataclass
+@dataclass(slots=True)
 class Thresholds:
     general: float
     character: float
 
-@dataclass
+@dataclass(slots=True)
 class Limits:
     general: int
     character: int
 
-@dataclass
+@dataclass(slots=True)
 class Behavior:
     enable_solo_character_limit: bool
     convert_underscore_to_space: bool
 
-@dataclass
+@dataclass(slots=True)
 class Window:
     geometry: str
     tag_display_rows: int = 6
     tag_display_cols: int = 5
 
-@dataclass
+@dataclass(slots=True)
 class Model:
     verified: bool
 
-@dataclass
+@dataclass(slots=True)
 class Debug:
     debug_log: bool
 
-@dataclass
+@dataclass(slots=True)
 class AppSettings:
     paths: Paths
     thresholds: Thresholds
@@ -59,136 +64,265 @@ class AppSettings:
     language_code: str
 
 # --- Config Utilities (from config_utils.py) ---
-from constants import BASE_DIR, CONFIG_PATH, MODEL_DIR_NAME
-
-def get_default_config() -> configparser.ConfigParser:
-    """Returns a ConfigParser object with default settings."""
-    config = configparser.ConfigParser()
-    DEFAULT_CONFIG = {
-        'Paths': {'input_dir': str(BASE_DIR / "inputs"), 'model_dir': MODEL_DIR_NAME, 'model_filename': 'model.onnx'},
-        'Thresholds': {'general': '0.40', 'character': '0.65'},
-        'Limits': {'general': '55', 'character': '1'},
-        'Behavior': {'enable_solo_character_limit': 'True', 'convert_underscore_to_space': 'True'},
-        'Window': {'geometry': '986x976+50+50', 'tag_display_rows': '6', 'tag_display_cols': '5'},
-        'Model': {'verified': 'False'},
-        'Debug': {'debug_log': 'False'},
-        'General': {'language_code': ''}
-    }
-    config.read_dict(DEFAULT_CONFIG)
-    return config
+from constants import BASE_DIR, CONFIG_PATH, CONFIG_PATH_STR, MODEL_DIR_NAME
+
+# Parsed settings keyed by the mtime of config.ini, so repeated worker-thread
+# lookups (see update_model_verification_status) don't re-read the file.
+_settings_cache: tuple[float, AppSettings] | None = None
+
+# (section, key, type, default) for every persisted setting, in file order.
+# Sections other than 'General' map to the AppSettings attribute of the same
+# name in lower case; 'General' holds the top-level fields.
+_FIELD_SPEC: tuple[tuple[str, str, type, str], ...] = (
+    ('Paths', 'input_dir', str, str(BASE_DIR / "inputs")),
+    ('Paths', 'model_dir', str, MODEL_DIR_NAME),
+    ('Paths', 'model_filename', str, 'model.onnx'),
+    ('Thresholds', 'general', float, '0.40'),
+    ('Thresholds', 'character', float, '0.65'),
+    ('Limits', 'general', int, '55'),
+    ('Limits', 'character', int, '1'),
+    ('Behavior', 'enable_solo_character_limit', bool, 'True'),
+    ('Behavior', 'convert_underscore_to_space', bool, 'True'),
+    ('Window', 'geometry', str, '986x976+50+50'),
+    ('Window', 'tag_display_rows', int, '6'),
+    ('Window', 'tag_display_cols', int, '5'),
+    ('Model', 'verified', bool, 'False'),
+    ('Debug', 'debug_log', bool, 'False'),
+    ('General', 'language_code', str, ''),
+)
+
+# How each declared type is written back to config.ini.
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    float: lambda v: f"{v:.2f}",
+    int: lambda v: str(int(v)),
+    bool: lambda v: str(bool(v)),
+    str: str,
+}
+
+# (section, key, getter, formatter) built once from _FIELD_SPEC so save_config
+# doesn't resolve attributes or dispatch on types per call.
+_SAVE_SPEC: tuple[tuple[str, str, Callable[[AppSettings], Any], Callable[[Any], str]], ...] = tuple(
+    (section, key, attrgetter(key if section == 'General' else f"{section.lower()}.{key}"), _FORMATTERS[value_type])
+    for section, key, value_type, _ in _FIELD_SPEC
+)
+
+def _build_save_template() -> str:
+    # Same layout ConfigParser.write() produces: "key = value" lines, blank line after each section.
+    parts: list[str] = []
+    current_section = None
+    for section, key, _, _ in _FIELD_SPEC:
+        if section != current_section:
+            if current_section is not None:
+                parts.append("\n")
+            parts.append(f"[{section}]\n")
+            current_section = section
+        parts.append(f"{key} = {{}}\n")
+    parts.append("\n")
+    return "".join(parts)
+
+# config.ini with one positional {} per _FIELD_SPEC entry, in order.
+_SAVE_TEMPLATE = _build_save_template()
+
+# Defaults keyed flat by (section, key), built once at import for load_config.
+_DEFAULT_VALUES: dict[tuple[str, str], str] = {(section, key): default for section, key, _, default in _FIELD_SPEC}
+
+# Flat view of config.ini as {(section, key): raw value}.
+ConfigData = dict[tuple[str, str], str]
+
+# Spellings configparser treats as true; anything else reads as False.
+_TRUE_STATES = frozenset(('1', 'yes', 'true', 'on'))
 
-def load_config() -> configparser.ConfigParser:
+def _fast_load(path: str) -> ConfigData:
+    """
+    Parses an INI file into a flat {(section, key): value} dict.
+    Only handles what save_config writes (sections and `key = value` lines);
+    keys are lower-cased and comment/blank lines skipped, as configparser does.
+    """
+    data: ConfigData = {}
+    section = ''
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line[0] in '#;':
+                continue
+            if line[0] == '[':
+                section = line[1:line.find(']')]
+                continue
+            key, sep, value = line.partition('=')
+            if sep:
+                data[(section, key.strip().lower())] = value.strip()
+    return data
+
+def load_config() -> ConfigData:
     """Loads the config.ini file, creating it from defaults if it doesn't exist."""
-    config = get_default_config()
-    if CONFIG_PATH.is_file():
-            
-        config.read(CONFIG_PATH, encoding='utf-8')
-        write_debug_log(_get_string("ConfigUtils", "Config_File_Load_Success", CONFIG_PATH=CONFIG_PATH), _get_string)
+    config: ConfigData = dict(_DEFAULT_VALUES)
+    if os.path.isfile(CONFIG_PATH_STR):
+        config.update(_fast_load(CONFIG_PATH_STR))
+        if is_debug_log_enabled():
+            write_debug_log(_get_string("ConfigUtils", "Config_File_Load_Success", CONFIG_PATH=CONFIG_PATH), _get_string)
     else:
         try:
-            with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-                config.write(f)
-            write_debug_log(_get_string("ConfigUtils", "Config_File_NotFound_Create_Default", CONFIG_PATH=CONFIG_PATH), _get_string)
+            _replace_file(CONFIG_PATH_STR, _SAVE_TEMPLATE.format(*_DEFAULT_VALUES.values()))
+            if is_debug_log_enabled():
+                write_debug_log(_get_string("ConfigUtils", "Config_File_NotFound_Create_Default", CONFIG_PATH=CONFIG_PATH), _get_string)
         except Exception as e:
             write_debug_log(_get_string("ConfigUtils", "Config_File_Creation_Failed", e=e), _get_string)
     return config
 
-def load_settings(config: configparser.ConfigParser) -> AppSettings:
-    """Loads settings from a ConfigParser object into an AppSettings dataclass."""
-        
+def load_settings(config: ConfigData) -> AppSettings:
+    """Loads settings from the dict returned by load_config() into an AppSettings dataclass."""
     return AppSettings(
         paths=Paths(
-            input_dir=config.get('Paths', 'input_dir', fallback=str(BASE_DIR / "inputs")),
-            model_dir=config.get('Paths', 'model_dir', fallback=MODEL_DIR_NAME),
-            model_filename=config.get('Paths', 'model_filename', fallback='model.onnx')
+            input_dir=config[('Paths', 'input_dir')],
+            model_dir=config[('Paths', 'model_dir')],
+            model_filename=config[('Paths', 'model_filename')]
         ),
         thresholds=Thresholds(
-            general=config.getfloat('Thresholds', 'general', fallback=0.40),
-            character=config.getfloat('Thresholds', 'character', fallback=0.65)
+            general=float(config[('Thresholds', 'general')]),
+            character=float(config[('Thresholds', 'character')])
         ),
         limits=Limits(
-            general=config.getint('Limits', 'general', fallback=55),
-            character=config.getint('Limits', 'character', fallback=1)
+            general=int(config[('Limits', 'general')]),
+            character=int(config[('Limits', 'character')])
         ),
         behavior=Behavior(
-            enable_solo_character_limit=config.getboolean('Behavior', 'enable_solo_character_limit', fallback=True),
-            convert_underscore_to_space=config.getboolean('Behavior', 'convert_underscore_to_space', fallback=True)
+            enable_solo_character_limit=config[('Behavior', 'enable_solo_character_limit')].lower() in _TRUE_STATES,
+            convert_underscore_to_space=config[('Behavior', 'convert_underscore_to_space')].lower() in _TRUE_STATES
         ),
         window=Window(
-            geometry=config.get('Window', 'geometry', fallback='986x976+50+50'),
-            tag_display_rows=config.getint('Window', 'tag_display_rows', fallback=6),
-            tag_display_cols=config.getint('Window', 'tag_display_cols', fallback=5)
+            geometry=config[('Window', 'geometry')],
+            tag_display_rows=int(config[('Window', 'tag_display_rows')]),
+            tag_display_cols=int(config[('Window', 'tag_display_cols')])
         ),
         model=Model(
-            verified=config.getboolean('Model', 'verified', fallback=False)
+            verified=config[('Model', 'verified')].lower() in _TRUE_STATES
         ),
         debug=Debug(
-            debug_log=config.getboolean('Debug', 'debug_log', fallback=False) # Default is False for debug_log
+            debug_log=config[('Debug', 'debug_log')].lower() in _TRUE_STATES # Default is False for debug_log
         ),
-        language_code=config.get('General', 'language_code', fallback="")
+        language_code=config[('General', 'language_code')]
     )
 
 def save_config(settings: AppSettings):
     """Saves the AppSettings object to the config.ini file."""
-    write_debug_log(_get_string("ConfigUtils", "Settings_Save_Start"), _get_string)
-    config = configparser.ConfigParser()
-
-    def _save_dataclass_to_config(config_parser: configparser.ConfigParser, dataclass_instance: Any, section_name: str):
-        if not config_parser.has_section(section_name):
-            config_parser.add_section(section_name)
-        
-        for field_info in fields(dataclass_instance):
-            value = getattr(dataclass_instance, field_info.name)
-            
-            if is_dataclass(value):
-                # Recursively handle nested dataclasses
-                _save_dataclass_to_config(config_parser, value, field_info.name.capitalize())
-            else:
-                # Convert value to string for configparser
-                if isinstance(value, float):
-                    config_parser.set(section_name, field_info.name, f"{value:.2f}")
-                elif isinstance(value, Path):
-                    config_parser.set(section_name, field_info.name, str(value))
-                else:
-                    config_parser.set(section_name, field_info.name, str(value))
-
-    # Handle top-level fields of AppSettings
-    for field_info in fields(settings):
-        value = getattr(settings, field_info.name)
-        if is_dataclass(value):
-            _save_dataclass_to_config(config, value, field_info.name.capitalize())
-        else:
-            # Handle language_code which is directly in AppSettings but belongs to 'General' section
-            if field_info.name == 'language_code':
-                if not config.has_section('General'):
-                    config.add_section('General')
-                config.set('General', field_info.name, str(value))
-            else:
-                # This case should ideally not be hit if AppSettings only contains nested dataclasses
-                # and language_code is handled specifically.
-                pass # Or raise an error if unexpected direct fields exist
-
-
+    if is_debug_log_enabled():
+        write_debug_log(_get_string("ConfigUtils", "Settings_Save_Start"), _get_string)
     try:
-        with open(CONFIG_PATH, 'w', encoding='utf-8') as f:
-            config.write(f)
-        write_debug_log(_get_string("ConfigUtils", "Config_File_Save_Success", CONFIG_PATH=CONFIG_PATH), _get_string)
+        _replace_file(CONFIG_PATH_STR, _SAVE_TEMPLATE.format(
+            *[formatter(getter(settings)) for _, _, getter, formatter in _SAVE_SPEC]
+        ))
+        if is_debug_log_enabled():
+            write_debug_log(_get_string("ConfigUtils", "Config_File_Save_Success", CONFIG_PATH=CONFIG_PATH), _get_string)
     except Exception as e:
         write_debug_log(_get_string("ConfigUtils", "Config_File_Save_Failed", e=e), _get_string)
+    _invalidate_settings_cache()
+
+def _invalidate_settings_cache():
+    global _settings_cache
+    _settings_cache = None
+
+def _config_mtime() -> float | None:
+    try:
+        return os.stat(CONFIG_PATH_STR).st_mtime
+    except OSError:
+        return None
+
+def _load_cached_settings() -> AppSettings:
+    """Returns the parsed settings, re-reading config.ini only when its mtime changed."""
+    global _settings_cache
+    mtime = _config_mtime()
+    cached = _settings_cache
+    if cached is not None and mtime is not None and cached[0] == mtime:
+        return cached[1]
+
+    settings = load_settings(load_config())
+    # load_config() may have just created the file, so stat again before caching.
+    mtime = _config_mtime()
+    if mtime is not None:
+        _settings_cache = (mtime, settings)
+    return settings
+
+@functools.lru_cache(maxsize=None)
+def _ini_value_pattern(section: str, key: str) -> re.Pattern[bytes]:
+    """Compiled pattern matching the `key = ` prefix (group 1) and value of key inside [section]; built once per target."""
+    return re.compile(
+        rb'(?ms)^(\[' + re.escape(section.encode()) + rb'\][^\[]*?^' + re.escape(key.encode()) + rb'[ \t]*=[ \t]*)[^\r\n]*'
+    )
+
+def _patch_bool(path: str, section: str, key: str, value: bool) -> bool:
+    """
+    Rewrites the value of a single `key = ...` line inside [section] of an INI file,
+    leaving the rest of the file untouched. Returns False if the key wasn't found.
+    """
+    pattern = _ini_value_pattern(section, key)
+    with open(path, 'rb') as f:
+        data = f.read()
+    patched, count = pattern.subn(lambda m: m.group(1) + str(value).encode(), data, count=1)
+    if not count:
+        return False
+
+    _replace_file(path, patched)
+    return True
+
+# On Windows os.replace fails with PermissionError while another handle (antivirus, the indexer,
+# a concurrent reader) has the target open; retry briefly before falling back to an in-place write.
+_REPLACE_ATTEMPTS = 5
+_REPLACE_RETRY_DELAY = 0.05
+
+def _write_content(path_or_fd: str | int, content: str | bytes):
+    if isinstance(content, bytes):
+        with open(path_or_fd, 'wb') as f:
+            f.write(content)
+    else:
+        with open(path_or_fd, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+def _replace_file(path: str, content: str | bytes):
+    """Writes content to a temp file next to path and swaps it in, so readers never see a partial file."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.config-', suffix='.tmp')
+    try:
+        os.chmod(tmp_path, 0o644)  # mkstemp creates owner-only files; keep the usual config.ini mode
+        _write_content(fd, content)
+        for attempt in range(_REPLACE_ATTEMPTS):
+            try:
+                os.replace(tmp_path, path)
+                return
+            except PermissionError:
+                if attempt + 1 < _REPLACE_ATTEMPTS:
+                    time.sleep(_REPLACE_RETRY_DELAY)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    # Still locked: write in place as before the atomic replace was introduced
+    os.unlink(tmp_path)
+    _write_content(path, content)
+
 def update_model_verification_status(is_verified: bool, get_string: GetString):
     """
     Loads config, sets model verification status, and saves it.
     Used by worker threads to update model status.
     """
+    global _settings_cache
+    cached = _settings_cache
+    if cached is not None and cached[1].model.verified == is_verified:
+        return
+
     try:
-        config = load_config()
-        settings = load_settings(config)
+        settings = _load_cached_settings()
         if settings.model.verified != is_verified:
-            settings.model.verified = is_verified
-            save_config(settings)
-            if is_verified:
-                write_debug_log(get_string("ConfigUtils", "ModelVerified_Success_Debug"), get_string)
+            # Change a copy: the cached object must keep the on-disk value until the write has succeeded
+            settings = replace(settings, model=replace(settings.model, verified=is_verified))
+            # Only the one line changes, so patch it in place rather than re-serialising everything.
+            if _patch_bool(CONFIG_PATH_STR, 'Model', 'verified', is_verified):
+                mtime = _config_mtime()
+                _settings_cache = (mtime, settings) if mtime is not None else None
             else:
-                write_debug_log(get_string("ConfigUtils", "ModelUnverified_Debug"), get_string)
+                save_config(settings)
+            if is_debug_log_enabled():
+                if is_verified:
+                    write_debug_log(get_string("ConfigUtils", "ModelVerified_Success_Debug"), get_string)
+                else:
+                    write_debug_log(get_string("ConfigUtils", "ModelUnverified_Debug"), get_string)
     except Exception as e:
+        _invalidate_settings_cache()
         write_debug_log(get_string("ConfigUtils", "ModelVerification_Update_Failed_Debug", e=e), get_string)
\ No newline at end of file
@@ -2,6 +2,9 @@ import sys
 from pathlib import Path
 from typing import Mapping
 
+# Resolved once at import; resolve() walks the path with stat/readlink calls.
+_SCRIPT_DIR = Path(__file__).parent.resolve()
+
 def get_resource_dir() -> Path:
     """
     Determines the resource directory, handling PyInstaller's _internal folder.
@@ -11,10 +14,10 @@ def get_resource_dir() -> Path:
         exe_dir = Path(sys.executable).parent
         internal_dir = exe_dir / "_internal"
         return internal_dir if internal_dir.is_dir() else exe_dir
-    return Path(__file__).parent.resolve()
+    return _SCRIPT_DIR
 
 # --- Path Constants ---
-BASE_DIR = Path(sys.executable).parent if getattr(sys, "frozen", False) else Path(__file__).parent.resolve()
+BASE_DIR = Path(sys.executable).parent if getattr(sys, "frozen", False) else _SCRIPT_DIR
 
 # RESOURCE_DIR is where bundled, non-user-editable resources are located.
 # This handles PyInstaller's `_internal` folder structure.
@@ -27,6 +30,9 @@ LANG_DIR = BASE_DIR / "lang"
 # User-facing paths are relative to BASE_DIR
 CONFIG_PATH = BASE_DIR / "config.ini"
 LOG_FILE_PATH = BASE_DIR / "debug_log.txt"
+# str forms for open()/stat() on the frequent config and log I/O paths
+CONFIG_PATH_STR = str(CONFIG_PATH)
+LOG_FILE_PATH_STR = str(LOG_FILE_PATH)
 
 # --- Model-related constants ---
 MODEL_SIZE_BYTES = 1271365853
@@ -43,6 +49,13 @@ TAGS_RU_CSV_PATH = BASE_DIR / MODEL_DIR_NAME / "selected_tags_ru.csv"
 TAGS_ZH_CN_CSV_PATH = BASE_DIR / MODEL_DIR_NAME / "selected_tags_zh_cn.csv"
 TAGS_ZH_TW_CSV_PATH = BASE_DIR / MODEL_DIR_NAME / "selected_tags_zh_tw.csv"
 TAGS_KO_CSV_PATH = BASE_DIR / MODEL_DIR_NAME / "selected_tags_ko.csv"
+# Argument order of tag_utils.load_tag_translation_map
+TAG_TRANSLATION_CSV_PATHS = (
+    TAGS_CSV_PATH, TAGS_JP_CSV_PATH, TAGS_FR_CSV_PATH, TAGS_DE_CSV_PATH, TAGS_ES_CSV_PATH,
+    TAGS_RU_CSV_PATH, TAGS_ZH_CN_CSV_PATH, TAGS_ZH_TW_CSV_PATH, TAGS_KO_CSV_PATH,
+)
+# Parsed translation map, reused while the CSVs above are unchanged
+TAG_TRANSLATION_CACHE_PATH = BASE_DIR / MODEL_DIR_NAME / "tag_translation_cache.pkl"
 DOWNLOAD_URLS: Mapping[Path, str] = {
     MODEL_PATH: "https://huggingface.co/deepghs/pixai-tagger-v0.9-onnx/resolve/main/model.onnx",
     MODEL_POINTER_PATH: "https://huggingface.co/deepghs/pixai-tagger-v0.9-onnx/raw/main/model.onnx",
@@ -51,6 +64,7 @@ DOWNLOAD_URLS: Mapping[Path, str] = {
 
 # --- Application settings ---
 IMAGE_EXTENSIONS = ['.png', '.jpg', '.jpeg', '.webp']
+IMAGE_EXTENSION_SET = frozenset(IMAGE_EXTENSIONS)  # For case-insensitive suffix membership tests
 TAGS_PER_PAGE = 16
 TAGS_PER_PAGE_FOR_IMAGE = 20
 MAX_LOG_LINES = 1000
@@ -64,6 +78,11 @@ STYLE_BTN_BLUE = "QPushButton { font-size: 16pt; padding: 10px; background-color
 STYLE_BTN_ORANGE = "QPushButton { font-size: 16pt; padding: 10px; background-color: #FF9800; color: white; }"
 STYLE_BTN_RED = "QPushButton { font-size: 16pt; padding: 10px; background-color: #F44336; color: white; }"
 STYLE_LIST_ITEM_SELECTED_DARK = "QListWidget::item:selected { background-color: #1a6b9a; color: #ffffff; }"
+# Tag buttons whose label overflows are left-aligned; set once on the main view and selected by the "alignLeft" property
+STYLE_TAG_BUTTON_ALIGNMENT = (
+    'QPushButton[alignLeft="true"] { text-align: left; padding-left: 5px; } '
+    'QPushButton[alignLeft="false"] { text-align: center; }'
+)
 
 # Light Theme Colors (current colors)
 COLOR_LOG_SUCCESS_LIGHT = "#00AA00"
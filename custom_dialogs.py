@@ -1,38 +1,94 @@
 from enum import IntFlag
 
 from PySide6.QtCore import (
-    Qt, Signal, QPoint, QRect, QEvent, QPointF
+    Qt, Signal, QPoint, QRect, QEvent, QPointF, QTimer, QSize
 )
 from PySide6.QtWidgets import (
-    QLabel, QDialog, QApplication, QVBoxLayout, QWidget
+    QLabel, QDialog, QApplication, QVBoxLayout, QWidget, QFrame, QStyle
 )
 from PySide6.QtGui import (
-    QMouseEvent, QPixmap, QKeyEvent, QWheelEvent, QResizeEvent, QPainter
+    QMouseEvent, QPixmap, QKeyEvent, QWheelEvent, QResizeEvent, QPainter, QPaintEvent
 )
 
 class ClickableLabel(QLabel):
     """A QLabel that emits a 'doubleClicked' signal on a double-click."""
     doubleClicked = Signal()
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Pixmap dimensions cached for the layout queries below, which Qt calls
+        # repeatedly during every resize. A size of 0x0 means "no pixmap".
+        self._pix_w = 0
+        self._pix_h = 0
+        # The (already scaled) pixmap being shown, painted directly in paintEvent.
+        self._pixmap: QPixmap | None = None
+
+    def setPixmap(self, pixmap: QPixmap):
+        super().setPixmap(pixmap)
+        if pixmap.isNull():
+            self._pix_w = self._pix_h = 0
+            self._pixmap = None
+        else:
+            self._pix_w, self._pix_h = pixmap.width(), pixmap.height()
+            self._pixmap = pixmap
+
+    def setText(self, text: str):
+        # QLabel.setText() replaces any pixmap that was shown.
+        super().setText(text)
+        self._pix_w = self._pix_h = 0
+        self._pixmap = None
+
+    def clear(self):
+        super().clear()
+        self._pix_w = self._pix_h = 0
+        self._pixmap = None
+
+    def paintEvent(self, event: QPaintEvent):
+        # Fast path for the common case: let QFrame draw the frame/background, then
+        # blit only the part of the pixmap inside the exposed rect. This skips QLabel's
+        # per-paint pixmap handling, so repaints triggered by tooltips or neighbouring
+        # widgets copy as few pixels as possible.
+        pixmap = self._pixmap
+        if pixmap is None or not self.isEnabled() or self.hasScaledContents():
+            super().paintEvent(event)
+            return
+        QFrame.paintEvent(self, event)
+        m = self.margin()
+        contents = self.contentsRect().adjusted(m, m, -m, -m)
+        dpr = pixmap.devicePixelRatio()
+        target = QStyle.alignedRect(self.layoutDirection(), self.alignment(),
+                                    pixmap.deviceIndependentSize().toSize(), contents)
+        exposed = target.intersected(event.rect())
+        if exposed.isEmpty():
+            return
+        source = QRect(round((exposed.x() - target.x()) * dpr), round((exposed.y() - target.y()) * dpr),
+                       round(exposed.width() * dpr), round(exposed.height() * dpr))
+        painter = QPainter(self)
+        painter.drawPixmap(exposed, pixmap, source)
+        painter.end()
+
     def mouseDoubleClickEvent(self, event: QMouseEvent):
         if event.button() == Qt.MouseButton.LeftButton:
             self.doubleClicked.emit()
         super().mouseDoubleClickEvent(event)
 
     def hasHeightForWidth(self) -> bool:
-        pixmap: QPixmap | None = self.pixmap()
-        return pixmap is not None and not pixmap.isNull() # type: ignore
+        return self._pix_w > 0
 
     def heightForWidth(self, width: int) -> int:
-        if self.pixmap() and not self.pixmap().isNull() and self.pixmap().width() > 0:
-            return int(width * (self.pixmap().height() / self.pixmap().width()))
+        if self._pix_w > 0:
+            return int(width * (self._pix_h / self._pix_w))
         return super().heightForWidth(width)
     
     def sizeHint(self):
-        if self.pixmap() and not self.pixmap().isNull():
-            return self.pixmap().size()
+        if self._pix_w > 0:
+            return QSize(self._pix_w, self._pix_h)
         return super().sizeHint()
 
+# Above this many pixels the zoomed image is painted straight from the original
+# instead of being pre-scaled, so deep zooms don't allocate enormous pixmaps.
+_MAX_PRESCALED_PIXELS = 4096 * 4096
+
 class ImageViewerDialog(QDialog):
     """
     A frameless dialog that displays an image. Operates in two distinct modes:
@@ -47,6 +103,18 @@ class ImageViewerDialog(QDialog):
         TopLeft = Top | Left; TopRight = Top | Right
         BottomLeft = Bottom | Left; BottomRight = Bottom | Right
 
+    # Cursor shape for each resize handle value; anything else gets the arrow.
+    _CURSOR_TABLE = {
+        ResizeHandle.TopLeft: Qt.CursorShape.SizeFDiagCursor, ResizeHandle.BottomRight: Qt.CursorShape.SizeFDiagCursor,
+        ResizeHandle.TopRight: Qt.CursorShape.SizeBDiagCursor, ResizeHandle.BottomLeft: Qt.CursorShape.SizeBDiagCursor,
+        ResizeHandle.Left: Qt.CursorShape.SizeHorCursor, ResizeHandle.Right: Qt.CursorShape.SizeHorCursor,
+        ResizeHandle.Top: Qt.CursorShape.SizeVerCursor, ResizeHandle.Bottom: Qt.CursorShape.SizeVerCursor,
+    }
+
+    # Navigation keys as plain ints, matching what QKeyEvent.key() returns.
+    _PREV_KEYS = frozenset(k.value for k in (Qt.Key.Key_Up, Qt.Key.Key_W, Qt.Key.Key_K, Qt.Key.Key_Left, Qt.Key.Key_H, Qt.Key.Key_A))
+    _NEXT_KEYS = frozenset(k.value for k in (Qt.Key.Key_Down, Qt.Key.Key_S, Qt.Key.Key_J, Qt.Key.Key_Right, Qt.Key.Key_L, Qt.Key.Key_D))
+
     def __init__(self, parent: QWidget | None = None, tag_panel_rect: QRect = QRect(), zoom_and_pan_enabled: bool = False):
         super().__init__(parent)
         self.setWindowFlag(Qt.WindowType.FramelessWindowHint)
@@ -61,9 +129,13 @@ class ImageViewerDialog(QDialog):
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setMouseTracking(True)
         
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.image_label)
+        if zoom_and_pan_enabled:
+            # Zoom mode places the label by hand at the pan offset (see _update_image_display).
+            self.image_label.setParent(self)
+        else:
+            layout = QVBoxLayout(self)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.addWidget(self.image_label)
         
         # --- State variables ---
         self._resizing = False
@@ -74,21 +146,37 @@ class ImageViewerDialog(QDialog):
         self._window_move_offset = QPoint()
         self._scale_factor = 1.0
         self._pan_offset: QPointF = QPointF(0, 0)
+        self._scaled_cache: tuple[tuple[int, float, bool], QPixmap] | None = None
+
+        # While zooming/resizing, redraw with fast scaling and only do the smooth
+        # pass once the interaction has been idle for a moment.
+        self._interacting = False
+        self._finalize_timer = QTimer(self)
+        self._finalize_timer.setSingleShot(True)
+        self._finalize_timer.setInterval(150)
+        self._finalize_timer.timeout.connect(self._finalize_view)
+
+        # Snapping runs on every drag/resize move, so keep the screen rect around.
+        primary_screen = QApplication.primaryScreen()
+        self._screen_rect = primary_screen.availableGeometry()
+        primary_screen.availableGeometryChanged.connect(self._on_screen_geometry_changed)
     
     def show_image(self, pixmap: QPixmap, dialog_width: int, dialog_height: int):
         self._original_pixmap = pixmap
+        self._scaled_cache = None
         self.resize(dialog_width, dialog_height)
         self._update_image_display()
 
     def setPixmap(self, pixmap: QPixmap):
         self._original_pixmap = pixmap
+        self._scaled_cache = None
         self.reset_view()
 
     def reset_view(self):
         if not (self._zoom_and_pan_enabled and self._original_pixmap): return
         
         pixmap_size = self._original_pixmap.size()
-        label_size = self.image_label.size()
+        label_size = self.size()
         if pixmap_size.isEmpty() or label_size.isEmpty(): return
 
         w_ratio = label_size.width() / pixmap_size.width()
@@ -108,23 +196,59 @@ class ImageViewerDialog(QDialog):
             return
 
         if self._zoom_and_pan_enabled:
-            # Create transformed pixmap in memory for zoom effect
-            target_pixmap = QPixmap(self.size()) # Use dialog size for the canvas
+            scaled = self._get_scaled_pixmap()
+            if scaled is not None:
+                # Show the scaled image as-is and pan by moving the label itself
+                self.image_label.setPixmap(scaled)
+                self.image_label.setGeometry(QRect(self._pan_offset.toPoint(), scaled.size()))
+                return
+
+            # Too large to pre-scale: paint just the visible part onto a dialog-sized canvas
+            target_pixmap = QPixmap(self.size())
             target_pixmap.fill(Qt.GlobalColor.transparent)
             
             painter = QPainter(target_pixmap)
-            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, not self._interacting)
             painter.translate(self._pan_offset)
             painter.scale(self._scale_factor, self._scale_factor)
             painter.drawPixmap(0, 0, self._original_pixmap)
             painter.end()
             self.image_label.setPixmap(target_pixmap)
+            self.image_label.setGeometry(self.rect())
         else:
             # Simple scaled pixmap for navigation mode
             scaled = self._original_pixmap.scaled(self.image_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                Qt.AspectRatioMode.KeepAspectRatio, self._transformation_mode())
             self.image_label.setPixmap(scaled)
 
+    def _get_scaled_pixmap(self) -> QPixmap | None:
+        """Returns the original pixmap scaled to the current zoom, reusing it while the scale is unchanged."""
+        key = (self._original_pixmap.cacheKey(), self._scale_factor, self._interacting)
+        if self._scaled_cache is not None and self._scaled_cache[0] == key:
+            return self._scaled_cache[1]
+
+        scaled_size = self._original_pixmap.size() * self._scale_factor
+        if scaled_size.isEmpty() or scaled_size.width() * scaled_size.height() > _MAX_PRESCALED_PIXELS:
+            self._scaled_cache = None
+            return None
+        scaled = self._original_pixmap.scaled(scaled_size,
+            Qt.AspectRatioMode.IgnoreAspectRatio, self._transformation_mode())
+        self._scaled_cache = (key, scaled)
+        return scaled
+
+    def _transformation_mode(self) -> Qt.TransformationMode:
+        if self._interacting:
+            return Qt.TransformationMode.FastTransformation
+        return Qt.TransformationMode.SmoothTransformation
+
+    def _begin_interaction(self):
+        self._interacting = True
+        self._finalize_timer.start()
+
+    def _finalize_view(self):
+        self._interacting = False
+        self._update_image_display()
+
     def wheelEvent(self, event: QWheelEvent):
         modifiers = event.modifiers()
         delta = event.angleDelta().y()
@@ -143,6 +267,7 @@ class ImageViewerDialog(QDialog):
             self._scale_factor *= zoom_factor
             self._pan_offset = mouse_pos - image_pos_before_zoom * self._scale_factor
             
+            self._begin_interaction()
             self._update_image_display()
             event.accept()
         else:
@@ -180,6 +305,7 @@ class ImageViewerDialog(QDialog):
                     new_width = int(new_rect.height() * ratio)
                     if self._resize_edge & self.ResizeHandle.Left: new_rect.setLeft(new_rect.right() - new_width)
                     else: new_rect.setRight(new_rect.left() + new_width)
+            self._begin_interaction()
             self.setGeometry(self._snap_to_edges(new_rect))
 
         # --- MODIFIED: Panning is now window moving for BOTH modes ---
@@ -209,9 +335,9 @@ class ImageViewerDialog(QDialog):
 
     def keyPressEvent(self, event: QKeyEvent):
         key = event.key()
-        if key in (Qt.Key_Up, Qt.Key_W, Qt.Key_K, Qt.Key_Left, Qt.Key_H, Qt.Key.Key_A): # type: ignore
+        if key in self._PREV_KEYS:
             self.prevImageRequested.emit()
-        elif key in (Qt.Key_Down, Qt.Key_S, Qt.Key_J, Qt.Key_Right, Qt.Key_L, Qt.Key.Key_D): # type: ignore
+        elif key in self._NEXT_KEYS:
             self.nextImageRequested.emit()
         elif key == Qt.Key.Key_Escape:
             self.close()
@@ -229,25 +355,19 @@ class ImageViewerDialog(QDialog):
         super().leaveEvent(event)
 
     def _get_cursor_for_position(self, pos: QPoint):
-        handle = self._get_resize_handle(pos)
-        if handle in (self.ResizeHandle.TopLeft, self.ResizeHandle.BottomRight): return Qt.CursorShape.SizeFDiagCursor
-        if handle in (self.ResizeHandle.TopRight, self.ResizeHandle.BottomLeft): return Qt.CursorShape.SizeBDiagCursor
-        if handle & (self.ResizeHandle.Left | self.ResizeHandle.Right): return Qt.CursorShape.SizeHorCursor
-        if handle & (self.ResizeHandle.Top | self.ResizeHandle.Bottom): return Qt.CursorShape.SizeVerCursor
-        return Qt.CursorShape.ArrowCursor
-
-    def _get_resize_handle(self, pos: QPoint) -> IntFlag:
-        margin = 15; width = self.width(); height = self.height()
-        handle = self.ResizeHandle.NoHandle
-        if pos.x() < margin: handle |= self.ResizeHandle.Left
-        if pos.x() > width - margin: handle |= self.ResizeHandle.Right
-        if pos.y() < margin: handle |= self.ResizeHandle.Top
-        if pos.y() > height - margin: handle |= self.ResizeHandle.Bottom
-        return handle
+        return self._CURSOR_TABLE.get(self._get_resize_handle(pos), Qt.CursorShape.ArrowCursor)
+
+    def _get_resize_handle(self, pos: QPoint) -> int:
+        # Packs the four edge tests into the ResizeHandle bit layout (Left, Right, Top, Bottom).
+        margin = 15; x = pos.x(); y = pos.y()
+        return (x < margin) | ((x > self.width() - margin) << 1) | ((y < margin) << 2) | ((y > self.height() - margin) << 3)
+
+    def _on_screen_geometry_changed(self, geometry: QRect):
+        self._screen_rect = geometry
 
     def _snap_to_edges(self, current_rect: QRect) -> QRect:
         snapped_rect = QRect(current_rect)
-        screen = QApplication.primaryScreen().availableGeometry()
+        screen = self._screen_rect
         threshold = 30
         if abs(snapped_rect.left() - screen.left()) < threshold: snapped_rect.setLeft(screen.left())
         if abs(snapped_rect.right() - screen.right()) < threshold: snapped_rect.setRight(screen.right())
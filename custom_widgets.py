@@ -1,90 +1,170 @@
-from pathlib import Path
+import os
+import time
 
-from PySide6.QtWidgets import QLineEdit, QListWidget, QWidget
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QKeyEvent, QWheelEvent
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QAbstractItemView, QLineEdit, QListWidget, QWidget
+from PySide6.QtGui import QDragEnterEvent, QDragLeaveEvent, QDropEvent, QMouseEvent
+from PySide6.QtCore import Qt, Signal, QTimer, QObject, QEvent
 
 
-from utils import write_debug_log, GetString, default_get_string_fallback
+from utils import write_debug_log, is_debug_log_enabled, GetString, default_get_string_fallback
 
 class PathLineEdit(QLineEdit):
-    # ... (class is unchanged) ...
+    """A QLineEdit that accepts a single folder dropped onto it."""
     folder_dropped = Signal(str)
+    # How long a drag-time isdir() result may be trusted by dropEvent before re-checking.
+    DROP_CACHE_TTL = 0.2
     def __init__(self, parent: QWidget | None = None, get_string: GetString | None = None):
         super().__init__(parent)
         self.get_string: GetString = get_string if get_string else default_get_string_fallback
         self.setAcceptDrops(True)
+        # (path, is_dir, checked_at) for the folder currently being dragged, so one drag gesture stats it once.
+        self._drag_cache: tuple[str, bool, float] | None = None
+    def _check_dir(self, path: str) -> bool:
+        is_dir = os.path.isdir(path)
+        self._drag_cache = (path, is_dir, time.monotonic())
+        return is_dir
+    def _is_dir_cached(self, path: str, max_age: float) -> bool:
+        cache = self._drag_cache
+        if cache is not None and cache[0] == path and time.monotonic() - cache[2] < max_age:
+            return cache[1]
+        return self._check_dir(path)
     def dragEnterEvent(self, event: QDragEnterEvent):
-        if event.mimeData().hasUrls():
-            urls = event.mimeData().urls()
+        mime_data = event.mimeData()
+        # Cheap format check first so text drags (including our own) never build a URL list.
+        if event.source() is not self and mime_data.hasFormat("text/uri-list"):
+            urls = mime_data.urls()
             if len(urls) == 1 and urls[0].isLocalFile():
-                path = urls[0].toLocalFile()
-                if Path(path).is_dir():
+                # Always stat here: a rejected drag gets no dragLeaveEvent, so an old entry may be stale.
+                if self._check_dir(urls[0].toLocalFile()):
                     event.acceptProposedAction()
                     return
         event.ignore()
+    def dragLeaveEvent(self, event: QDragLeaveEvent):
+        self._drag_cache = None
+        super().dragLeaveEvent(event)
     def dropEvent(self, event: QDropEvent):
         urls = event.mimeData().urls()
         if urls and urls[0].isLocalFile():
             path = urls[0].toLocalFile()
-            if Path(path).is_dir():
+            is_dir = self._is_dir_cached(path, self.DROP_CACHE_TTL)
+            self._drag_cache = None
+            if is_dir:
                 self.setText(path)
                 self.folder_dropped.emit(path)
                 event.acceptProposedAction()
                 return
+        self._drag_cache = None
         event.ignore()
 
 
+class TagListNavFilter(QObject):
+    """
+    Event filter that implements TagListWidget's keyboard and Ctrl + wheel navigation.
+    Everything it doesn't handle passes straight through to Qt's own processing,
+    so ordinary key/wheel events never round-trip through a Python override.
+    """
+    def __init__(self, list_widget: 'TagListWidget'):
+        super().__init__(list_widget)
+        self._list = list_widget
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        event_type = event.type()
+        if event_type == QEvent.Type.KeyPress:
+            direction = self._list._KEY_DIRECTIONS.get(event.key())
+            if direction is None:
+                return False
+            self._list._navigate_by_key(direction, event.isAutoRepeat())
+            return True
+        if event_type == QEvent.Type.Wheel and event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+            # Ctrl + wheel navigates to the previous/next image; plain wheel scrolls as usual.
+            delta = event.angleDelta().y()
+            if delta > 0:
+                self._list._throttled_step(-1)
+            elif delta < 0:
+                self._list._throttled_step(1)
+            event.accept()
+            return True
+        return False
+
+
 class TagListWidget(QListWidget):
     """A QListWidget that supports keyboard selection and Ctrl + wheel navigation."""
+    # Emitted after a mouse release has been fully handled, i.e. after any itemClicked it caused.
+    mouse_released = Signal()
+    # Minimum spacing between steps for Ctrl + wheel and held-down arrow keys.
+    NAVIGATION_THROTTLE_MS = 60
+
+    # Key code -> row direction for the vim/WASD/arrow navigation keys.
+    _KEY_DIRECTIONS: dict[int, int] = {
+        **{key.value: -1 for key in (Qt.Key.Key_Up, Qt.Key.Key_W, Qt.Key.Key_A, Qt.Key.Key_H, Qt.Key.Key_K, Qt.Key.Key_Left)},
+        **{key.value: 1 for key in (Qt.Key.Key_Down, Qt.Key.Key_S, Qt.Key.Key_D, Qt.Key.Key_J, Qt.Key.Key_L, Qt.Key.Key_Right)},
+    }
+
     def __init__(self, parent: QWidget | None = None, get_string: GetString | None = None):
         super().__init__(parent)
         self.get_string: GetString = get_string if get_string else default_get_string_fallback
+        self.refresh_locale()
 
-    def keyPressEvent(self, event: QKeyEvent):
-        key = event.key()
-        
-        if key in (Qt.Key.Key_Up, Qt.Key.Key_W, Qt.Key.Key_A, Qt.Key.Key_H, Qt.Key.Key_K, Qt.Key.Key_Left):
-            current = self.currentRow()
-            if current > 0:
-                self.setCurrentRow(current - 1)
-                self.itemClicked.emit(self.currentItem())
-                self.scrollToItem(self.currentItem())
-                write_debug_log(str(self.get_string("CustomWidgets", "Image_List_Key_Up")), self.get_string)
-        
-        elif key in (Qt.Key.Key_Down, Qt.Key.Key_S, Qt.Key.Key_D, Qt.Key.Key_J, Qt.Key.Key_L, Qt.Key.Key_Right):
-            current = self.currentRow()
-            if current < self.count() - 1:
-                self.setCurrentRow(current + 1)
-                self.itemClicked.emit(self.currentItem())
-                self.scrollToItem(self.currentItem())
-                write_debug_log(str(self.get_string("CustomWidgets", "Image_List_Key_Down")), self.get_string)
-        
-        else:
-            super().keyPressEvent(event)
-
-    def wheelEvent(self, event: QWheelEvent):
-        """
-        Overrides the default wheel event.
-        - With Ctrl key: Navigates to the previous/next image.
-        - Without Ctrl key: Performs the standard list scrolling.
-        """
-        # --- MODIFIED: Use bitwise AND for a more robust check ---
-        if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
-            delta = event.angleDelta().y()
-            current = self.currentRow()
+        # Leading + trailing throttle: the first step runs immediately, further
+        # steps within the interval collapse into one that runs when it expires.
+        self._pending_step = 0
+        self._navigation_timer = QTimer(self)
+        self._navigation_timer.setSingleShot(True)
+        self._navigation_timer.setInterval(self.NAVIGATION_THROTTLE_MS)
+        self._navigation_timer.timeout.connect(self._flush_pending_step)
 
-            if delta > 0:
-                if current > 0:
-                    self.setCurrentRow(current - 1)
-                    self.itemClicked.emit(self.currentItem())
-                    self.scrollToItem(self.currentItem())
-            elif delta < 0:
-                if current < self.count() - 1:
-                    self.setCurrentRow(current + 1)
-                    self.itemClicked.emit(self.currentItem())
-                    self.scrollToItem(self.currentItem())
-            
-            event.accept()
-        else:
-            super().wheelEvent(event)
\ No newline at end of file
+        # Wheel events are delivered to the viewport, key events to the list itself.
+        self._nav_filter = TagListNavFilter(self)
+        self.installEventFilter(self._nav_filter)
+        self.viewport().installEventFilter(self._nav_filter)
+
+    def mouseReleaseEvent(self, event: QMouseEvent):
+        super().mouseReleaseEvent(event)
+        self.mouse_released.emit()
+
+    def refresh_locale(self):
+        """Re-reads the localized navigation log messages. The UI language is fixed at startup, so this only runs once today."""
+        self._msg_key_up = str(self.get_string("CustomWidgets", "Image_List_Key_Up"))
+        self._msg_key_down = str(self.get_string("CustomWidgets", "Image_List_Key_Down"))
+
+    def _step(self, direction: int) -> bool:
+        """Moves the selection one row up (-1) or down (+1). Returns False at either end of the list."""
+        current = self.currentRow()
+        if direction < 0:
+            if current <= 0:
+                return False
+        elif current >= self.count() - 1:
+            return False
+        # Select and scroll as one repaint. Listeners are notified through the
+        # currentItemChanged signal that setCurrentItem() emits.
+        self.setUpdatesEnabled(False)
+        try:
+            item = self.item(current + direction)
+            self.setCurrentItem(item)
+            # Only scroll when the new row isn't already fully on screen.
+            if not self.viewport().rect().contains(self.visualItemRect(item)):
+                self.scrollToItem(item, QAbstractItemView.ScrollHint.EnsureVisible)
+        finally:
+            self.setUpdatesEnabled(True)
+        return True
+
+    def _throttled_step(self, direction: int):
+        if self._navigation_timer.isActive():
+            # Latest direction wins, so reversing mid-burst isn't delayed by stale input.
+            self._pending_step = direction
+            return
+        self._step(direction)
+        self._navigation_timer.start()
+
+    def _flush_pending_step(self):
+        if self._pending_step:
+            direction = self._pending_step
+            self._pending_step = 0
+            self._step(direction)
+            self._navigation_timer.start()
+
+    def _navigate_by_key(self, direction: int, auto_repeat: bool):
+        if auto_repeat:
+            self._throttled_step(direction)
+        elif self._step(direction) and is_debug_log_enabled():
+            write_debug_log(self._msg_key_up if direction < 0 else self._msg_key_down, self.get_string)
\ No newline at end of file
@@ -1,8 +1,10 @@
+from __future__ import annotations
+import re
 import sys
-import locale
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-
-import requests
+from typing import TYPE_CHECKING
 
 if __name__ == '__main__':
     # If executed directly as a script, add the project root to the path.
@@ -12,8 +14,31 @@ if __name__ == '__main__':
 
 from constants import MODEL_POINTER_PATH, BASE_DIR
 from utils import write_debug_log, GetString, default_get_string_fallback
-from app_settings import load_config, load_settings
-from locale_manager import LocaleManager
+
+if TYPE_CHECKING:
+    import requests
+
+# Git LFS pointers list keys alphabetically, so the oid line always precedes size.
+_POINTER_RE = re.compile(rb'(?ms)^oid sha256:([0-9a-fA-F]{64})[ \t\r]*$.*?^size[ \t]+(\d+)[ \t\r]*$')
+
+# Shared so repeated pointer checks reuse the pooled HTTPS connection instead of
+# paying a new TCP/TLS handshake each time. Created on first use, together with
+# the requests import, so importing this module doesn't load the HTTP stack.
+_session: requests.Session | None = None
+
+def _get_session() -> requests.Session:
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util import Retry
+
+        session = requests.Session()
+        # Transient failures get two quick retries before surfacing as RequestException.
+        session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=4,
+                                              max_retries=Retry(total=2, backoff_factor=0.2)))
+        _session = session
+    return _session
 
 def get_model_info_from_pointer(url: str, get_string: GetString | None = None) -> tuple[str | None, int | None]:
     """
@@ -26,24 +51,20 @@ def get_model_info_from_pointer(url: str, get_string: GetString | None = None) -
     Returns:
         A tuple containing the SHA256 OID (str) and the size (int). (None, None) if retrieval or parsing fails.
     """
+    import requests  # deferred; cached in sys.modules after the first call
     _get_string: GetString = get_string if get_string else default_get_string_fallback
 
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()  # Raise an exception if the status code is not in the 200 range.
-        
-        lines = response.text.strip().split('\n')
-        oid_line = next((line for line in lines if line.startswith('oid sha256:')), None)
-        size_line = next((line for line in lines if line.startswith('size ')), None)
-
-        if not oid_line or not size_line:
+        with _get_session().get(url, timeout=10, stream=True) as response:
+            response.raise_for_status()  # Raise an exception if the status code is not in the 200 range.
+            # Pointer files are ~130 bytes; match the raw bytes in one pass, no text decoding.
+            match = _POINTER_RE.search(response.content)
+
+        if match is None:
             write_debug_log(_get_string("GetPointerHuggingface", "Error_OidOrSizeNotFound"), _get_string)
             return None, None
 
-        sha256_oid = oid_line.split(':')[1].strip()
-        size = int(size_line.split(' ')[1].strip())
-        
-        return sha256_oid, size
+        return match.group(1).decode('ascii'), int(match.group(2))
 
     except requests.exceptions.RequestException as e:
         write_debug_log(_get_string("GetPointerHuggingface", "Error_FetchFailed", e=e), _get_string)
@@ -52,12 +73,33 @@ def get_model_info_from_pointer(url: str, get_string: GetString | None = None) -
         write_debug_log(_get_string("GetPointerHuggingface", "Error_ParseFailed", e=e), _get_string)
         return None, None
 
+# Background threads for get_model_info_from_pointer_async, created on first use.
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+def get_model_info_from_pointer_async(url: str, get_string: GetString | None = None) -> Future[tuple[str | None, int | None]]:
+    """
+    Runs get_model_info_from_pointer on a background thread and returns a Future for its result,
+    so callers can keep processing events (or poll a stop flag) instead of blocking for the
+    request timeout. Qt callers should marshal the result back with a signal.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="PointerFetch")
+        executor = _executor
+    return executor.submit(get_model_info_from_pointer, url, get_string)
+
 if __name__ == '__main__':
+    # Only needed when run as a script, so importers of this module don't pay for them.
+    from app_settings import load_config, load_settings
+    from locale_manager import LocaleManager
+    from main_window import get_os_language
+
     config = load_config()
     settings = load_settings(config)
-    default_locale = locale.getdefaultlocale()[0]
-    os_lang = default_locale.split('_')[0] if default_locale else "en"
-    locale_manager = LocaleManager(settings.language_code or os_lang, BASE_DIR)
+    # Same detection as the GUI; Windows locale names such as 'Japanese_Japan' aren't ISO codes.
+    locale_manager = LocaleManager(settings.language_code or get_os_language(), BASE_DIR)
     _ = locale_manager.get_string
 
     sha256, size = get_model_info_from_pointer(str(MODEL_POINTER_PATH), get_string=_)
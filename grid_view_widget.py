@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import List
 
@@ -6,8 +7,8 @@ from PySide6.QtWidgets import (
     QPushButton, QGridLayout, QSizePolicy, QScrollArea, QFrame, QToolTip,
     QApplication
 )
-from PySide6.QtCore import Qt, Signal, Slot, QRect, QObject, QEvent
-from PySide6.QtGui import QPixmap, QWheelEvent, QResizeEvent
+from PySide6.QtCore import Qt, Signal, Slot, QRect, QObject, QEvent, QTimer, QSize, QRunnable, QThreadPool
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache, QWheelEvent, QResizeEvent, QShowEvent
 
 import tag_utils
 from locale_manager import LocaleManager
@@ -15,6 +16,94 @@ from app_settings import AppSettings
 from custom_dialogs import ClickableLabel, ImageViewerDialog
 
 TAGS_PER_PAGE_GRID = 14
+# Headroom for decoded grid thumbnails over QPixmapCache's 10 MB default.
+PIXMAP_CACHE_LIMIT_KB = 256 * 1024
+
+
+def thumbnail_cache_key(image_path: Path, target: QSize) -> str:
+    """
+    Returns the QPixmapCache key for image_path decoded to fit target, or "" if the file
+    can't be stat'ed. The key includes the file's mtime and the target size, so an edited
+    image or a new cell size decodes again.
+    """
+    path_str = str(image_path)
+    try:
+        return f"{path_str}|{os.stat(path_str).st_mtime_ns}|{target.width()}x{target.height()}"
+    except OSError:
+        return ""
+
+
+def decode_thumbnail(path_str: str, target: QSize) -> QImage:
+    """
+    Decodes the image to fit target. QImageReader decodes straight at the reduced size
+    (JPEG can downscale during the DCT), so a large photo never materialises at full
+    resolution. Only touches QImage, so it is safe to call from a worker thread.
+    """
+    reader = QImageReader(path_str)
+    source_size = reader.size()
+    if source_size.isValid():
+        reader.setScaledSize(source_size.scaled(target, Qt.AspectRatioMode.KeepAspectRatio))
+        return reader.read()
+    # Format can't report its size up front: decode fully, then scale.
+    image = reader.read()
+    if not image.isNull():
+        image = smart_scale(image, target)
+    return image
+
+
+class _ThumbnailSignals(QObject):
+    finished = Signal(int, str, QImage)  # (generation, cache key, decoded image)
+
+
+class ThumbnailJob(QRunnable):
+    """Decodes one grid thumbnail on a QThreadPool thread and reports back through signals."""
+    def __init__(self, path_str: str, target: QSize, key: str, generation: int, signals: _ThumbnailSignals):
+        super().__init__()
+        self.path_str = path_str
+        self.target = QSize(target)
+        self.key = key
+        self.generation = generation
+        self.signals = signals
+
+    def run(self):
+        image = decode_thumbnail(self.path_str, self.target)
+        self.signals.finished.emit(self.generation, self.key, image)
+
+
+def full_image_cache_key(image_path: Path) -> str:
+    """Returns the QPixmapCache key for image_path at full resolution, or "" if it can't be stat'ed."""
+    path_str = str(image_path)
+    try:
+        return f"{path_str}|{os.stat(path_str).st_mtime_ns}|full"
+    except OSError:
+        return ""
+
+
+class _PrefetchSignals(QObject):
+    finished = Signal(str, QImage)  # (cache key, decoded image)
+
+
+class PrefetchJob(QRunnable):
+    """Decodes a full-resolution image on a QThreadPool thread so the viewer can show it instantly."""
+    def __init__(self, path_str: str, key: str, signals: _PrefetchSignals):
+        super().__init__()
+        self.path_str = path_str
+        self.key = key
+        self.signals = signals
+
+    def run(self):
+        self.signals.finished.emit(self.key, QImageReader(self.path_str).read())
+
+
+def smart_scale(image: QImage, target: QSize) -> QImage:
+    """
+    Scales to fit target with near-smooth quality at close to fast-scaling cost:
+    a fast downscale to ~4x the target, then a smooth pass from there.
+    """
+    intermediate = target * 4
+    if image.width() > intermediate.width() and image.height() > intermediate.height():
+        image = image.scaled(intermediate, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
+    return image.scaled(target, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
 
 
 def filter_images_by_tag(
@@ -63,20 +152,46 @@ class ImageEditCellWidget(QWidget):
         super().__init__(parent)
         self.locale_manager = locale_manager
         self._image_path: Path | None = None
+        self._txt_path: Path | None = None  # tag_utils.get_txt_path(self._image_path), kept in step with it
         self.tag_buttons: List[QPushButton] = []
         self._current_tag_page = 0
+        self._total_tag_pages = 1  # Updated whenever the tag list is (re)displayed
         self._global_index = -1  # To store the image's index in the main list
         
         self.tag_translation_map: dict[str, list[str]] = {}
         self._tag_display_language: str = "English"
         self._search_text: str = ""
+        # (pixmap cache key, label size) of the pixmap currently shown, to skip redundant rescaling
+        self._shown_pixmap_state: tuple[str, tuple[int, int]] | None = None
+        # Parsed tags of the current .txt file and the (mtime_ns, size) they were read at
+        self._cached_tags: list[str] | None = None
+        self._cached_mtime: tuple[int, int] | None = None
+
+        # Thumbnails decode on the global thread pool; results from an outdated request
+        # (the user paged on before it finished) are dropped by generation.
+        self._image_generation = 0
+        self._pending_image_state: tuple[str, tuple[int, int]] | None = None
+        self._thumbnail_signals = _ThumbnailSignals(self)
+        self._thumbnail_signals.finished.connect(self._on_thumbnail_ready)
+
+        # Set when a refresh was skipped because the cell was hidden; replayed in showEvent
+        self._image_stale = False
+        self._tags_stale = False
+
+        self._image_refresh_timer = QTimer(self)
+        self._image_refresh_timer.setSingleShot(True)
+        self._image_refresh_timer.setInterval(0)
+        self._image_refresh_timer.timeout.connect(self._refresh_image)
 
         self.setMinimumSize(300, 300)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(2, 2, 2, 2)
-        layout.setSpacing(2)
+        self._cell_layout = QHBoxLayout(self)
+        self._cell_layout.setContentsMargins(2, 2, 2, 2)
+        self._cell_layout.setSpacing(2)
+        # Tag editing widgets are built on first load_data(); cells that never
+        # receive an image (short last page) never pay for them.
+        self._tag_side_built = False
 
         self.image_label = ClickableLabel()
         self.image_label.setText(self.locale_manager.get_string("GridView", "No_Image"))
@@ -86,9 +201,10 @@ class ImageEditCellWidget(QWidget):
         self.image_label.setStyleSheet("border: 1px solid grey;")
         # --- MODIFIED: Connect to a slot that emits the new signal ---
         self.image_label.doubleClicked.connect(self._on_double_click)
-        layout.addWidget(self.image_label, 1)
+        self._cell_layout.addWidget(self.image_label, 1)
 
-        # ... (rest of the __init__ method is unchanged) ...
+    def _build_tag_side(self):
+        """Builds the tag list, tag paging and add-tag row to the right of the image."""
         tag_area_widget = QWidget()
         tag_layout = QVBoxLayout(tag_area_widget)
         tag_layout.setContentsMargins(0, 0, 0, 0)
@@ -100,6 +216,15 @@ class ImageEditCellWidget(QWidget):
         self.tag_grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         for i in range(2): self.tag_grid_layout.setColumnStretch(i, 1)
         for i in range(7): self.tag_grid_layout.setRowStretch(i, 1)
+        # Fixed pool of tag buttons, re-labelled on each refresh instead of recreated
+        for i in range(TAGS_PER_PAGE_GRID):
+            btn = QPushButton()
+            btn.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Expanding)
+            btn.clicked.connect(self._on_tag_button_clicked)
+            btn.installEventFilter(self)
+            btn.hide()
+            self.tag_grid_layout.addWidget(btn, i % 7, i // 7)
+            self.tag_buttons.append(btn)
         scroll_area.setWidget(scroll_widget)
         tag_layout.addWidget(scroll_area, 1)
         tag_pagination_layout = QHBoxLayout()
@@ -123,7 +248,8 @@ class ImageEditCellWidget(QWidget):
         add_tag_layout.addWidget(self.add_tag_line)
         add_tag_layout.addWidget(add_button)
         tag_layout.addLayout(add_tag_layout)
-        layout.addWidget(tag_area_widget, 1)
+        self._cell_layout.addWidget(tag_area_widget, 1)
+        self._tag_side_built = True
 
     # --- ADDED: Slot to handle the double click and emit the request ---
     @Slot()
@@ -135,10 +261,19 @@ class ImageEditCellWidget(QWidget):
     def load_data(self, image_path: Path, global_index: int):
         prev_path = self._image_path
         self._image_path = image_path
+        if prev_path != image_path:
+            self._txt_path = tag_utils.get_txt_path(image_path)
         self._global_index = global_index
+        if not self._tag_side_built:
+            self._build_tag_side()
         # 同じ画像の場合はタグページを保持、異なる画像の場合のみリセット
         if prev_path != image_path:
             self._current_tag_page = 0
+            # Don't leave the previous image next to the new tags while decoding
+            self._shown_pixmap_state = None
+            self.image_label.clear()
+            self._cached_tags = None
+            self._cached_mtime = None
         self._update_tag_display()
     
     def _get_translation_index(self, language: str) -> int:
@@ -158,67 +293,150 @@ class ImageEditCellWidget(QWidget):
     # ... (rest of the class is unchanged) ...
     def resizeEvent(self, event: QResizeEvent):
         super().resizeEvent(event)
-        self._update_tag_display()
+        # Only the image depends on the size; coalesce a burst of resizes into one rescale.
+        if self.isVisible():
+            self._image_refresh_timer.start()
+        else:
+            self._image_stale = True
+    def showEvent(self, event: QShowEvent):
+        super().showEvent(event)
+        if self._tags_stale:
+            self._refresh_tags()
+        if self._image_stale:
+            self._image_refresh_timer.start()
+    @staticmethod
+    def _stat_key(txt_path: Path) -> tuple[int, int] | None:
+        try:
+            st = txt_path.stat()
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    def _get_tags(self) -> list[str]:
+        """Return the current image's tags, re-reading the .txt only when it changed on disk."""
+        txt_path = self._txt_path
+        assert txt_path is not None
+        mtime = self._stat_key(txt_path)
+        if self._cached_tags is None or mtime != self._cached_mtime:
+            self._cached_tags = tag_utils.read_tags(txt_path) if mtime is not None else []
+            self._cached_mtime = mtime
+        return self._cached_tags
+    def _write_tags(self, txt_path: Path, tags: list[str]) -> bool:
+        """Write tags to disk and keep the in-memory cache in step. Returns False if the write failed."""
+        if not tag_utils.write_tags(txt_path, tags):
+            # The file may be untouched or half-written; re-read it on the next _get_tags
+            self._cached_tags = None
+            return False
+        self._cached_tags = tags
+        self._cached_mtime = self._stat_key(txt_path)
+        return True
     def _update_tag_display(self):
+        self._refresh_image()
+        self._refresh_tags()
+    def _refresh_image(self):
+        if not self.isVisible():
+            # Hidden cells (other view shown, unused slot) decode nothing until shown
+            self._image_stale = self._image_path is not None
+            return
+        self._image_stale = False
         if self._image_path and self.image_label.width() > 0 and self.image_label.height() > 0:
-            pixmap = QPixmap(str(self._image_path))
-            if not pixmap.isNull():
-                scaled_pixmap = pixmap.scaled(self.image_label.size(), 
-                                              Qt.AspectRatioMode.KeepAspectRatio, 
-                                              Qt.TransformationMode.SmoothTransformation)
-                self.image_label.setPixmap(scaled_pixmap)
-        for btn in self.tag_buttons:
-            btn.deleteLater()
-        self.tag_buttons.clear()
+            label_size = self.image_label.size()
+            cache_key = thumbnail_cache_key(self._image_path, label_size)
+            state = (cache_key, (label_size.width(), label_size.height()))
+            if not cache_key or state == self._shown_pixmap_state or state == self._pending_image_state:
+                return
+            pixmap = QPixmapCache.find(cache_key)
+            if pixmap is not None and not pixmap.isNull():
+                self._image_generation += 1
+                self._pending_image_state = None
+                self.image_label.setPixmap(pixmap)
+                self._shown_pixmap_state = state
+                return
+            self._image_generation += 1
+            self._pending_image_state = state
+            QThreadPool.globalInstance().start(ThumbnailJob(
+                str(self._image_path), label_size, cache_key, self._image_generation, self._thumbnail_signals))
+    @Slot(int, str, QImage)
+    def _on_thumbnail_ready(self, generation: int, cache_key: str, image: QImage):
+        if generation != self._image_generation:
+            return
+        state = self._pending_image_state
+        self._pending_image_state = None
+        if image.isNull():
+            return
+        # QPixmap may only be created on the GUI thread
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(cache_key, pixmap)
+        self.image_label.setPixmap(pixmap)
+        self._shown_pixmap_state = state
+    def _refresh_tags(self):
+        if not self._tag_side_built:
+            return
         if not self._image_path: 
+            self._hide_tag_buttons()
             self.prev_tag_page_btn.setEnabled(False)
             self.next_tag_page_btn.setEnabled(False)
             return
-        txt_path = tag_utils.get_txt_path(self._image_path)
-        tags = tag_utils.read_tags(txt_path)
+        if not self.isVisible():
+            self._tags_stale = True
+            return
+        self._tags_stale = False
+        tags = self._get_tags()
         total_tags = len(tags)
         # ページ範囲チェック（タグ削除等でページが範囲外になった場合の補正）
-        total_pages = max(1, (total_tags + TAGS_PER_PAGE_GRID - 1) // TAGS_PER_PAGE_GRID)
-        if self._current_tag_page >= total_pages:
-            self._current_tag_page = max(0, total_pages - 1)
+        self._total_tag_pages = max(1, (total_tags + TAGS_PER_PAGE_GRID - 1) // TAGS_PER_PAGE_GRID)
+        if self._current_tag_page >= self._total_tag_pages:
+            self._current_tag_page = self._total_tag_pages - 1
         start_index = self._current_tag_page * TAGS_PER_PAGE_GRID
         end_index = min(start_index + TAGS_PER_PAGE_GRID, total_tags)
         current_page_tags = tags[start_index:end_index]
         
         # 翻訳リストのインデックスを取得
         lang_index = self._get_translation_index(self._tag_display_language)
+        # ハイライト判定: 検索文字列が非空かつタグ名に部分一致する場合（AND検索の各キーワードで判定）
+        needles = [t.strip().lower() for t in self._search_text.split(",") if t.strip()]
+        base_style = "font-size: 11pt; text-align: left; padding-left: 3px;"
+        highlight_style = base_style
+        if needles:
+            is_dark = self.palette().window().color().lightness() < 128
+            hl_color = "#4a5a2a" if is_dark else "#c8f0a0"
+            highlight_style = f"{base_style} background-color: {hl_color};"
         
-        for i, tag in enumerate(current_page_tags):
-            display_text = tag
+        # Re-label and show/hide the pool as one batch: one repaint of the tag
+        # area instead of one per button.
+        tag_area = self.tag_grid_layout.parentWidget()
+        tag_area.setUpdatesEnabled(False)
+        try:
+            for i, tag in enumerate(current_page_tags):
+                display_text = tag
             
-            # 英語以外かつ、辞書にタグが存在する場合
-            if lang_index != -1 and tag in self.tag_translation_map:
-                try:
-                    translations = self.tag_translation_map[tag]
-                    if len(translations) > lang_index:
+                # 英語以外かつ、辞書にタグが存在する場合
+                if lang_index != -1:
+                    translations = self.tag_translation_map.get(tag)
+                    if translations is not None and len(translations) > lang_index:
                         display_text = translations[lang_index]
-                except IndexError:
-                    pass # エラー時は英語のまま
             
-            btn = QPushButton(display_text)
-            btn.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Expanding)
-            # ハイライト判定: 検索文字列が非空かつタグ名に部分一致する場合（AND検索の各キーワードで判定）
-            needles = [t.strip().lower() for t in self._search_text.split(",") if t.strip()]
-            style = "font-size: 11pt; text-align: left; padding-left: 3px;"
-            if needles and any(n in tag.lower() for n in needles):
-                is_dark = self.palette().window().color().lightness() < 128
-                hl_color = "#4a5a2a" if is_dark else "#c8f0a0"
-                style += f" background-color: {hl_color};"
-            btn.setStyleSheet(style)
-            btn.setToolTip(tag) # Tooltip always shows English tag
-            btn.setProperty("original_tag", tag)
-            btn.clicked.connect(lambda checked=False, t=tag: self._remove_tag(t))
-            btn.installEventFilter(self)
-            row = i % 7; col = i // 7
-            self.tag_grid_layout.addWidget(btn, row, col)
-            self.tag_buttons.append(btn)
+                btn = self.tag_buttons[i]
+                btn.setText(display_text)
+                style = highlight_style if needles and any(n in tag.lower() for n in needles) else base_style
+                if btn.styleSheet() != style: # Re-polishing is the expensive part; skip when unchanged
+                    btn.setStyleSheet(style)
+                btn.setToolTip(tag) # Tooltip always shows English tag
+                btn.setProperty("original_tag", tag)
+                btn.show()
+            for btn in self.tag_buttons[len(current_page_tags):]:
+                btn.hide()
+        finally:
+            tag_area.setUpdatesEnabled(True)
         self.prev_tag_page_btn.setEnabled(self._current_tag_page > 0)
-        self.next_tag_page_btn.setEnabled(end_index < total_tags)
+        self.next_tag_page_btn.setEnabled(self._current_tag_page + 1 < self._total_tag_pages)
+    def _hide_tag_buttons(self):
+        for btn in self.tag_buttons:
+            btn.hide()
+    @Slot()
+    def _on_tag_button_clicked(self):
+        tag = self.sender().property("original_tag")
+        if tag:
+            self._remove_tag(tag)
     @Slot()
     def _add_tag(self):
         if not self._image_path:
@@ -227,8 +445,8 @@ class ImageEditCellWidget(QWidget):
         if not tags_to_add_str: return
         tags_to_add = [t.strip() for t in tags_to_add_str.split(',') if t.strip()]
         if not tags_to_add: return
-        txt_path = tag_utils.get_txt_path(self._image_path)
-        existing_tags = tag_utils.read_tags(txt_path)
+        txt_path = self._txt_path
+        existing_tags = self._get_tags()
         actually_new_tags: list[str] = []; any_duplicates = False
         for tag in tags_to_add:
             if tag in existing_tags: any_duplicates = True
@@ -240,42 +458,39 @@ class ImageEditCellWidget(QWidget):
             tooltip_pos = self.add_tag_line.mapToGlobal(self.add_tag_line.rect().bottomLeft())
             QToolTip.showText(tooltip_pos, tooltip_message, self.add_tag_line)
         if actually_new_tags:
-            if tag_utils.add_tags_to_file(txt_path, actually_new_tags):
-                self._update_tag_display()
-                # Emit signal for undo/redo
+            written = self._write_tags(txt_path, existing_tags + actually_new_tags)
+            self._refresh_tags()
+            # Emit signal for undo/redo, only for edits that reached the disk
+            if written:
                 self.tags_added.emit(txt_path, actually_new_tags)
     @Slot(str)
     def _remove_tag(self, tag_to_remove: str):
         if not self._image_path: return
-        txt_path = tag_utils.get_txt_path(self._image_path)
+        txt_path = self._txt_path
         
         # Get original index before removal
-        existing_tags = tag_utils.read_tags(txt_path)
-        original_index = existing_tags.index(tag_to_remove) if tag_to_remove in existing_tags else -1
+        existing_tags = self._get_tags()
+        if tag_to_remove not in existing_tags: return
+        original_index = existing_tags.index(tag_to_remove)
         
-        if tag_utils.remove_tag_from_file(txt_path, tag_to_remove):
-            tags = tag_utils.read_tags(txt_path)
-            total_pages = (len(tags) + TAGS_PER_PAGE_GRID - 1) // TAGS_PER_PAGE_GRID
-            total_pages = max(1, total_pages)
-            if self._current_tag_page >= total_pages: self._current_tag_page = max(0, total_pages - 1)
-            self._update_tag_display()
-            
-            # Emit signal for undo/redo
-            if original_index >= 0:
-                self.tag_removed.emit(txt_path, tag_to_remove, original_index)
+        written = self._write_tags(txt_path, existing_tags[:original_index] + existing_tags[original_index + 1:])
+        # _refresh_tags clamps the page if the last tag of the final page was removed
+        self._refresh_tags()
+        
+        # Emit signal for undo/redo, only for edits that reached the disk
+        if written:
+            self.tag_removed.emit(txt_path, tag_to_remove, original_index)
     @Slot()
     def _prev_tag_page(self):
         if self._current_tag_page > 0:
             self._current_tag_page -= 1
-            self._update_tag_display()
+            self._refresh_tags()
     @Slot()
     def _next_tag_page(self):
         if not self._image_path: return
-        txt_path = tag_utils.get_txt_path(self._image_path)
-        tags = tag_utils.read_tags(txt_path)
-        if (self._current_tag_page + 1) * TAGS_PER_PAGE_GRID < len(tags):
+        if self._current_tag_page + 1 < self._total_tag_pages:
             self._current_tag_page += 1
-            self._update_tag_display()
+            self._refresh_tags()
     def eventFilter(self, watched: QObject, event: QEvent) -> bool:
         """Filters events from watched objects to handle right-click and hover on tag buttons."""
         if event.type() == QEvent.Type.MouseButtonRelease:
@@ -303,7 +518,6 @@ class ImageEditCellWidget(QWidget):
     def _copy_tag_to_clipboard(self, tag_name: str):
         """Copies the tag with a trailing comma to clipboard."""
         from PySide6.QtGui import QCursor
-        from PySide6.QtCore import QTimer
         clipboard = QApplication.clipboard()
         clipboard.setText(tag_name + ", ")
         # Show a tooltip to indicate success at the current cursor position
@@ -314,24 +528,32 @@ class ImageEditCellWidget(QWidget):
     
     def clear_data(self):
         self._image_path = None
+        self._txt_path = None
         self._global_index = -1
         self._current_tag_page = 0
+        self._total_tag_pages = 1
+        self._shown_pixmap_state = None
+        self._image_generation += 1
+        self._pending_image_state = None
+        self._cached_tags = None
+        self._cached_mtime = None
+        self._image_stale = self._tags_stale = False
         self.image_label.clear()
         self.image_label.setText(self.locale_manager.get_string("GridView", "No_Image"))
-        for btn in self.tag_buttons: btn.deleteLater()
-        self.tag_buttons.clear()
-        self.prev_tag_page_btn.setEnabled(False)
-        self.next_tag_page_btn.setEnabled(False)
+        if self._tag_side_built:
+            self._hide_tag_buttons()
+            self.prev_tag_page_btn.setEnabled(False)
+            self.next_tag_page_btn.setEnabled(False)
 
     def set_tag_display_language(self, language: str, translation_map: dict[str, list[str]]):
         self._tag_display_language = language
         self.tag_translation_map = translation_map
-        self._update_tag_display()
+        self._refresh_tags()
 
     def set_search_text(self, text: str):
         """検索文字列を設定し、タグ表示を更新する。"""
         self._search_text = text
-        self._update_tag_display()
+        self._refresh_tags()
 
 class GridViewWidget(QWidget):
     back_to_main_requested = Signal()
@@ -357,7 +579,12 @@ class GridViewWidget(QWidget):
         # --- ADDED: State management for the dialog ---
         self._image_viewer_dialog: ImageViewerDialog | None = None
         self._current_dialog_image_index = -1
+        # Neighbours of the viewed image are decoded ahead of time into QPixmapCache
+        self._prefetch_pending: set[str] = set()
+        self._prefetch_signals = _PrefetchSignals(self)
+        self._prefetch_signals.finished.connect(self._on_prefetch_ready)
 
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), PIXMAP_CACHE_LIMIT_KB))
         self.initUI()
     
     def initUI(self):
@@ -498,9 +725,14 @@ class GridViewWidget(QWidget):
             return
 
         path = self._image_paths[index]
-        pixmap = QPixmap(str(path))
-        if pixmap.isNull():
-            return
+        key = full_image_cache_key(path)
+        pixmap = QPixmapCache.find(key) if key else None
+        if pixmap is None or pixmap.isNull():
+            pixmap = QPixmap(str(path))
+            if pixmap.isNull():
+                return
+            if key:
+                QPixmapCache.insert(key, pixmap)
 
         # Set initial size and position only if it's the first time showing
         if not self._image_viewer_dialog.isVisible():
@@ -510,6 +742,28 @@ class GridViewWidget(QWidget):
             self._image_viewer_dialog.move(screen_rect.center() - self._image_viewer_dialog.rect().center())
         
         self._image_viewer_dialog.setPixmap(pixmap)
+        self._prefetch_neighbours(index)
+
+    def _prefetch_neighbours(self, index: int):
+        for neighbour in (index + 1, index - 1):
+            if not 0 <= neighbour < len(self._image_paths):
+                continue
+            path = self._image_paths[neighbour]
+            key = full_image_cache_key(path)
+            if not key or key in self._prefetch_pending:
+                continue
+            cached = QPixmapCache.find(key)
+            if cached is not None and not cached.isNull():
+                continue
+            self._prefetch_pending.add(key)
+            QThreadPool.globalInstance().start(PrefetchJob(str(path), key, self._prefetch_signals))
+
+    @Slot(str, QImage)
+    def _on_prefetch_ready(self, key: str, image: QImage):
+        self._prefetch_pending.discard(key)
+        if not image.isNull():
+            # QPixmap may only be created on the GUI thread
+            QPixmapCache.insert(key, QPixmap.fromImage(image))
 
     # --- ADDED: Slots for handling navigation signals from the dialog ---
     @Slot()
@@ -1,17 +1,39 @@
 import configparser
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 from utils import write_debug_log
 
 
 class LocaleManager:
+    # Flattened translations per (lang_code, base_dir), shared by every instance
+    # so each language file is parsed at most once per process.
+    _cache: ClassVar[dict[tuple[str, Path], dict[tuple[str, str], str]]] = {}
+
     def __init__(self, lang_code: str, base_dir: Path):
         self.lang_code = lang_code
         self.base_dir = base_dir
         self.translations = self._load_translations()
 
-    def _load_translations(self) -> configparser.ConfigParser:
+    def _load_translations(self) -> dict[tuple[str, str], str]:
+        """Returns {(section, lowercased key): raw string} for this language, parsing on first use."""
+        cache_key = (self.lang_code, self.base_dir)
+        translations = LocaleManager._cache.get(cache_key)
+        if translations is None:
+            translations = self._flatten(self._read_config())
+            LocaleManager._cache[cache_key] = translations
+        return translations
+
+    @staticmethod
+    def _flatten(config: configparser.ConfigParser) -> dict[tuple[str, str], str]:
+        # raw=True: the strings are str.format templates, not configparser interpolations
+        return {
+            (section, key): value
+            for section in config.sections()
+            for key, value in config.items(section, raw=True)
+        }
+
+    def _read_config(self) -> configparser.ConfigParser:
         config = configparser.ConfigParser()
         primary_path = self.base_dir / f"{self.lang_code}.ini"
         fallback_path = self.base_dir / "en.ini"
@@ -30,19 +52,19 @@ class LocaleManager:
                 config.read(fallback_path, encoding="utf-8")
             except Exception as e:
                 write_debug_log(f"Failed to read fallback language file {fallback_path}: {e}")
-        
+
         # If both fail, return an empty config to prevent crashes
         return config
 
     def get_string(self, section: str, key: str, **kwargs: Any) -> str:
+        # ConfigParser lowercases option names, so lookups do too; a missing entry falls back to the key
+        raw_string = self.translations.get((section, key.lower()), key)
+        if not kwargs:
+            # Plain labels are the common case; format() would only re-copy them
+            return raw_string
         try:
-            raw_string = self.translations.get(section, key, fallback=key)
-            try:
-                return raw_string.format(**kwargs)
-            except (KeyError, ValueError) as e:
-                # Log the formatting error but return the raw string to avoid crashing
-                write_debug_log(f"LocaleManager format error for key '{key}' in section '{section}': {e}. Kwargs: {kwargs}")
-                return raw_string
-        except (configparser.NoSectionError, configparser.NoOptionError):
-            # Fallback to key if not found
-            return key.replace("_", " ").capitalize()
+            return raw_string.format(**kwargs)
+        except (KeyError, ValueError) as e:
+            # Log the formatting error but return the raw string to avoid crashing
+            write_debug_log(f"LocaleManager format error for key '{key}' in section '{section}': {e}. Kwargs: {kwargs}")
+            return raw_string
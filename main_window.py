@@ -1,11 +1,16 @@
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Mapping, Protocol
+from typing import Any, Callable, Mapping, Protocol
 import functools
+import os
+import re
 import sys
+import threading
+import time
 
 from PySide6.QtCore import (
-    Qt, QThread, QObject, Signal, Slot, QTimer, QPoint, QRect, QEvent, QEventLoop
+    Qt, QThread, QThreadPool, QObject, Signal, Slot, QTimer, QPoint, QRect, QSize, QEvent
 )
 from PySide6.QtWidgets import (
     QMainWindow, QWidget,
@@ -14,25 +19,46 @@ from PySide6.QtWidgets import (
     QStackedWidget, QApplication, QSplitter, QListWidgetItem, QComboBox
 )
 from PySide6.QtGui import (
-    QPixmap, QImage, QKeyEvent, QResizeEvent, QDragEnterEvent,
-    QDropEvent, QCloseEvent, QWheelEvent,
+    QPixmap, QKeyEvent, QResizeEvent, QDragEnterEvent,
+    QDropEvent, QCloseEvent, QWheelEvent, QFontMetrics,
     QPalette
 )
 
-from utils import write_debug_log
+from utils import write_debug_log, scan_image_paths
 import constants
 import app_settings # Added import
 from app_settings import load_config, load_settings, save_config # Updated import
 from custom_widgets import PathLineEdit, TagListWidget
 import tag_utils
-from tag_utils import load_tag_translation_map
 from custom_dialogs import ClickableLabel, ImageViewerDialog
 from grid_view_widget import GridViewWidget
-from workers import DownloaderWorker, TaggerThreadWorker, TagLoader, BulkTagWorker
+from workers import (
+    DownloaderWorker, TaggerThreadWorker, TagLoader, BulkTagWorker, TranslationMapLoader,
+    ImageScanJob, ImageScanSignals
+)
 from locale_manager import LocaleManager
 from ui_main_window import Ui_MainWindow
 from undo_manager import UndoManager, AddTagsAction, RemoveTagAction, BulkAddTagsAction, BulkRemoveTagsAction
 
+# Number of recently viewed full-resolution images kept decoded in memory.
+IMAGE_PIXMAP_CACHE_SIZE = 8
+# Parsed .txt sidecars kept for the edit -> reload round trips on the selected image
+TAG_FILE_CACHE_SIZE = 64
+# Size changes smaller than this (in both dimensions) don't re-scale the preview or re-align tag buttons
+RESIZE_TOLERANCE_PX = 4
+# Upper bound on memoized tag label widths before the memo is reset
+TEXT_WIDTH_CACHE_SIZE = 4096
+# Tag input normalization: any whitespace run (incl. full-width U+3000) becomes one space,
+# and a comma with any surrounding whitespace/commas is one separator
+_TAG_INPUT_WHITESPACE_RE = re.compile(r'\s+')
+_TAG_INPUT_SEPARATOR_RE = re.compile(r'\s*,[\s,]*')
+
+# Windows primary language IDs (lower 10 bits of a LANGID) to ISO 639-1 codes
+_WINDOWS_LANG_MAP = {0x09: "en", 0x11: "ja", 0x07: "de", 0x0c: "fr", 0x12: "ko", 0x04: "zh"}
+# Seconds between shutdown checks while a worker waits for the overwrite dialog's answer.
+_OVERWRITE_WAIT_POLL = 0.1
+
+@functools.lru_cache(maxsize=1)
 def get_os_language() -> str:
     """
     Gets the OS's UI language in a robust, cross-platform way.
@@ -47,9 +73,7 @@ def get_os_language() -> str:
             lang_id = windll.GetUserDefaultUILanguage()
             # Primary language ID is in the lower 10 bits
             primary_lang_id = lang_id & 0x3FF
-            # A map for common primary language IDs to ISO 639-1 codes
-            lang_map = {0x09: "en", 0x11: "ja", 0x07: "de", 0x0c: "fr", 0x12: "ko", 0x04: "zh"}
-            return lang_map.get(primary_lang_id, "en")
+            return _WINDOWS_LANG_MAP.get(primary_lang_id, "en")
     except Exception as e:
         write_debug_log(f"Failed to get OS language via ctypes: {e}")
 
@@ -119,6 +143,7 @@ class MainWindow(QMainWindow):
         self.language_combo.currentIndexChanged.connect(self.toggle_tag_language)
 
         self._apply_image_list_selection_style()
+        self.main_view_widget.setStyleSheet(constants.STYLE_TAG_BUTTON_ALIGNMENT)
         self._install_event_filters()
 
         write_debug_log(self.locale_manager.get_string("MainWindow", "MainWindow_Init_Complete"))
@@ -141,6 +166,8 @@ class MainWindow(QMainWindow):
 
         self._is_dark_theme = QApplication.palette().color(QPalette.ColorRole.Window).lightness() < 128
         self._log_color_map = self._get_log_color_map()
+        # Per-color line prefix with the timestamp as a strftime template, built once instead of on every update_log call
+        self._log_line_templates = {color: f'<span style="color:{html_color};">[%H:%M:%S] ' for color, html_color in self._log_color_map.items()}
         
     def _initialize_state(self):
         """Initializes all state variables for the main window."""
@@ -154,15 +181,47 @@ class MainWindow(QMainWindow):
         self._bulk_tag_worker: BulkTagWorker | None = None
         self.tag_thread: QThread | None = None
         self.tag_worker: TagLoader | None = None
+        self._translation_thread: QThread | None = None
+        self._translation_loader: TranslationMapLoader | None = None
+        # Quit threads (and their workers) kept alive until QThread.finished; see _retire_thread
+        self._retiring_threads: list[tuple[QThread, QObject | None]] = []
 
         # UI State variables
         self._all_tags: list[tuple[str, int]] = []
         self._current_page: int = 0  # For bulk tag view
+        self._total_tag_pages: int = 1  # Kept in step with _all_tags
         self._current_image_tags: list[str] = []
         self._current_image_tag_page: int = 0
+        # The grid geometry only comes from config.ini, so the page size is fixed for the session
+        self._image_tags_per_page: int = max(1, self.settings.window.tag_display_cols * self.settings.window.tag_display_rows)
+        self._total_image_tag_pages: int = 1  # Kept in step with _current_image_tags
         self._original_image_pixmap: QPixmap | None = None
+        # settings.paths.input_dir as a Path, rebuilt by _input_dir_path() only when the string changes
+        self._input_dir_cache: tuple[str, Path] | None = None
+        # Relative path of each image_list row, filled alongside the list in _populate_image_list
+        self._row_to_relpath: list[str] = []
+        # Image folder scans run on the thread pool; results of superseded scans are dropped by generation
+        self._image_scan_generation = 0
+        self._image_scan_auto_select: str | None = None
+        self._image_scan_selected = False
+        self._image_scan_signals = ImageScanSignals()
+        self._image_scan_signals.batch_ready.connect(self._on_image_scan_batch)
+        self._image_scan_signals.finished.connect(self._on_image_scan_finished)
+        # LRU of decoded originals keyed by "path|mtime_ns"
+        self._pixmap_cache: OrderedDict[str, QPixmap] = OrderedDict()
+        # LRU of parsed tag files: txt path -> ((mtime_ns, size), tags)
+        self._tag_file_cache: OrderedDict[Path, tuple[tuple[int, int], list[str]]] = OrderedDict()
+        # (original cacheKey, width, height, smooth) of the pixmap in image_label
+        self._last_scaled_state: tuple[int, int, int, bool] | None = None
+        # Window size the tag button alignments were last computed for
+        self._last_aligned_size: QSize | None = None
+        # horizontalAdvance() per label text, valid for _text_width_font_key only
+        self._text_width_cache: dict[str, int] = {}
+        self._text_width_font_key: str | None = None
+        # Tag button pools: grown on demand, re-labelled per page, hidden when unused
         self.tag_buttons: list[QPushButton] = []
         self.tag_buttons_for_image: list[QPushButton] = []
+        self._image_tag_grid_cols = 0  # Column count the image tag pool is currently laid out for
 
         # Processing State variables
         self._is_downloading = False
@@ -173,18 +232,38 @@ class MainWindow(QMainWindow):
         # Timers and Dialogs
         self._resize_timer = QTimer(self)
         self._resize_timer.setSingleShot(True)
-        self._resize_timer.setInterval(100)
+        self._resize_timer.setInterval(300)
+        # Coalesces rapid wheel/viewer navigation so only the image finally landed on is loaded
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(30)
+        self._nav_timer.timeout.connect(self._load_pending_nav_item)
+        self._pending_nav_item: QListWidgetItem | None = None
+        # Item that currentItemChanged already loaded during the current mouse click; reset on every release
+        self._press_selected_item: QListWidgetItem | None = None
+        # Debounces config.ini writes while a slider is being dragged
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(300)
+        self._save_timer.timeout.connect(self.save_current_config)
+        # Coalesces alignment requests from page flips and resizes into one pass per frame
+        self._align_timer = QTimer(self)
+        self._align_timer.setSingleShot(True)
+        self._align_timer.setInterval(16)
+        self._align_timer.timeout.connect(self.update_all_button_alignments)
+        self._navigating = False
         self.loading_timer: QTimer | None = None
         self.loading_state = 0
         self._sliders: dict[str, tuple[QSlider, QLabel]] = {}
         self._image_viewer_dialog: ImageViewerDialog | None = None
         
-        self._overwrite_event_loop: QEventLoop | None = None
+        # Set by the GUI thread once the overwrite dialog has been answered; the tagger thread waits on it
+        self._overwrite_reply_event = threading.Event()
         
         # Undo/Redo Manager
         self.undo_manager = UndoManager(max_history=50)
+        self._undo_refresh_pending = False
         self._overwrite_response: bool | None = None
-        self._worker_finished_event_loop: QEventLoop | None = None
         self._last_navigation_event_time: datetime | None = None # 追加
         
         self.tag_translation_map: dict[str, list[str]] = {}
@@ -199,21 +278,11 @@ class MainWindow(QMainWindow):
 
     def initial_load(self):
         """Performs the initial loading of images and tags after the main window is shown."""
-        # ここで9個すべての引数を順番に渡します
-        self.tag_translation_map = load_tag_translation_map(
-            constants.TAGS_CSV_PATH,          # english_csv_path
-            constants.TAGS_JP_CSV_PATH,       # japanese_csv_path
-            constants.TAGS_FR_CSV_PATH,       # french_csv_path
-            constants.TAGS_DE_CSV_PATH,       # german_csv_path
-            constants.TAGS_ES_CSV_PATH,       # spanish_csv_path
-            constants.TAGS_RU_CSV_PATH,       # russian_csv_path
-            constants.TAGS_ZH_CN_CSV_PATH,    # zh_cn_csv_path
-            constants.TAGS_ZH_TW_CSV_PATH,    # zh_tw_csv_path
-            constants.TAGS_KO_CSV_PATH        # korean_csv_path
-        )
+        # The translation map arrives later via _on_translation_map_loaded; tags show in English until then
+        self._start_translation_map_load()
         self.reload_image_list()
         self.reload_tags_only()
-        self._update_undo_redo_buttons()
+        self._schedule_undo_refresh()
 
     def _apply_image_list_selection_style(self):
         """ダークモード時にファイルリストの選択色を見やすい色に上書きする。"""
@@ -230,35 +299,71 @@ class MainWindow(QMainWindow):
     def reload_image_list(self, auto_select_path: str | None = None):
         """Reloads the list of images from the input directory."""
         self.image_label.setPixmap(QPixmap()) # Explicitly clear pixmap
-        input_dir_path = Path(self.settings.paths.input_dir)
+        input_dir_path = self._input_dir_path()
         self.image_list.clear()
+        self._row_to_relpath = []
+        self._image_scan_generation += 1 # Drops batches still arriving from an earlier scan
         self.image_label.setText(self.locale_manager.get_string("MainWindow", "Loading_Image_List"))
 
         if not self._ensure_input_dir_exists(input_dir_path):
             return
 
         write_debug_log(self.locale_manager.get_string("MainWindow", "Reloading_Image_List", input_dir_path=input_dir_path))
-        image_paths = self._get_image_paths(input_dir_path)
+        # The scan runs off the GUI thread; _on_image_scan_batch fills the list as results arrive.
+        self._image_scan_auto_select = auto_select_path
+        self._image_scan_selected = False
+        QThreadPool.globalInstance().start(ImageScanJob(input_dir_path, self._image_scan_generation, self._image_scan_signals))
+
+    @Slot(int, object)
+    def _on_image_scan_batch(self, generation: int, entries: list[tuple[str, Path]]):
+        """Appends a batch of scanned images to the list, selecting the target image once it arrives."""
+        if generation != self._image_scan_generation:
+            return
+        selected_item = self._populate_image_list(entries, self._image_scan_auto_select)
+        if selected_item is None and not self._image_scan_selected and not self._image_scan_auto_select:
+            # No particular image requested: show the first one without waiting for the rest
+            selected_item = self.image_list.item(0)
+        if selected_item is not None and not self._image_scan_selected:
+            self._select_scanned_item(selected_item)
 
-        if not image_paths:
+    @Slot(int, int)
+    def _on_image_scan_finished(self, generation: int, total: int):
+        """Completes a reload once every batch of the scan has been added."""
+        if generation != self._image_scan_generation or self._is_shutting_down:
+            return
+        if total == 0:
+            input_dir_path = self._input_dir_path()
             self.image_label.setText(self.locale_manager.get_string("MainWindow", "Image_Files_Not_Found"))
             self.update_log(self.locale_manager.get_string("MainWindow", "Warning_No_Image_Files_Found", input_dir_path_name=input_dir_path.name), "orange")
             return
-            
-        selected_item = self._populate_image_list(image_paths, auto_select_path)
-            
-        if not selected_item and self.image_list.count() > 0:
-            selected_item = self.image_list.item(0)
-        
-        if selected_item:
-            self.image_list.setCurrentItem(selected_item)
-            # Schedule the image loading to ensure the widget is sized correctly
-            QTimer.singleShot(100, lambda: self._load_and_fit_image(selected_item))
-        else:
-            self._clear_image_display()
+
+        if not self._image_scan_selected:
+            # The requested image wasn't found; fall back to the first one
+            if self.image_list.count() > 0:
+                self._select_scanned_item(self.image_list.item(0))
+            else:
+                self._clear_image_display()
 
         self._build_tag_cache()
-        self.update_log(self.locale_manager.get_string("MainWindow", "List_Updated_Total_Images", count=len(image_paths)), "blue")
+        self.update_log(self.locale_manager.get_string("MainWindow", "List_Updated_Total_Images", count=total), "blue")
+
+    def _select_scanned_item(self, selected_item: QListWidgetItem):
+        """Makes selected_item current and schedules its image to load."""
+        self._image_scan_selected = True
+        # Don't load via currentItemChanged here; the deferred load below runs once the widget is sized.
+        self.image_list.blockSignals(True)
+        self.image_list.setCurrentItem(selected_item)
+        self.image_list.blockSignals(False)
+        # Schedule the image loading to ensure the widget is sized correctly.
+        # Capture the scan generation, not the item: a reload before the timer fires deletes the item.
+        generation = self._image_scan_generation
+        QTimer.singleShot(100, lambda: self._load_scanned_selection(generation))
+
+    def _load_scanned_selection(self, generation: int):
+        """Deferred load for _select_scanned_item; loads whatever is current now, unless the list was reloaded since."""
+        if generation != self._image_scan_generation or self._is_shutting_down:
+            return
+        self._load_and_fit_image(self.image_list.currentItem())
 
     def _ensure_input_dir_exists(self, path: Path) -> bool:
         """Checks if the input directory exists, creating it if necessary. Returns True on success."""
@@ -275,26 +380,41 @@ class MainWindow(QMainWindow):
 
     def _get_image_paths(self, base_path: Path) -> list[Path]:
         """Recursively finds all image files in the given directory."""
-        paths: list[Path] = []
-        for ext in constants.IMAGE_EXTENSIONS:
-             paths.extend(base_path.rglob(f"*{ext}")) 
-        return sorted(paths)
-
-    def _populate_image_list(self, paths: list[Path], auto_select: str | None) -> QListWidgetItem | None:
-        """Adds image paths to the list widget and determines which item to select."""
+        return scan_image_paths(base_path)
+
+    def _input_dir_path(self) -> Path:
+        """Returns the input directory as a Path, reusing the last one while the setting is unchanged."""
+        input_dir = self.settings.paths.input_dir
+        cached = self._input_dir_cache
+        if cached is None or cached[0] != input_dir:
+            cached = self._input_dir_cache = (input_dir, Path(input_dir))
+        return cached[1]
+
+    def _item_relpath(self, item: QListWidgetItem) -> str:
+        """Returns the image path of an image_list item, relative to the input directory."""
+        return self._row_to_relpath[self.image_list.row(item)]
+
+    def _populate_image_list(self, entries: list[tuple[str, Path]], auto_select: str | None) -> QListWidgetItem | None:
+        """Appends (relative path, path) scan entries to the list widget. Returns the item matching auto_select, if among them."""
         selected_item = None
-        input_dir = Path(self.settings.paths.input_dir)
-        for path in paths:
-            relative_path = str(path.relative_to(input_dir))
-            item = QListWidgetItem(path.name)
-            item.setData(Qt.ItemDataRole.UserRole + 1, relative_path)
-            self.image_list.addItem(item)
-            
-            if auto_select and (path.name == auto_select or relative_path == auto_select):
-                 selected_item = item
-        
-        if not selected_item and self.image_list.count() > 0:
-            selected_item = self.image_list.item(0)
+        path_role = Qt.ItemDataRole.UserRole + 1
+        image_list = self.image_list
+        row_to_relpath = self._row_to_relpath
+        add_item, add_relpath = image_list.addItem, row_to_relpath.append
+        image_list.setUpdatesEnabled(False)
+        image_list.blockSignals(True)
+        try:
+            for relative_path, path in entries:
+                item = QListWidgetItem(path.name)
+                item.setData(path_role, relative_path)
+                add_item(item)
+                add_relpath(relative_path)
+                
+                if auto_select and (path.name == auto_select or relative_path == auto_select):
+                     selected_item = item
+        finally:
+            image_list.blockSignals(False)
+            image_list.setUpdatesEnabled(True)
         
         return selected_item
 
@@ -312,21 +432,16 @@ class MainWindow(QMainWindow):
                 # 古いスレッドのシグナルを切断して二重発火を防ぐ
                 try:
                     self.tag_worker.tags_loaded.disconnect(self._update_bulk_tag_buttons)
+                    self.tag_worker.finished.disconnect(self._on_tag_loader_finished)
                 except RuntimeError:
                     pass
-            self.tag_thread.quit()
-            self.tag_thread.wait(1000) # Wait up to 1 second for the thread to finish
-            if self.tag_thread.isRunning():
-                self.tag_thread.terminate() # Force terminate if it doesn't stop
             
-            # Clean up old thread and worker
-            if self.tag_worker:
-                self.tag_worker.deleteLater()
-            self.tag_thread.deleteLater()
+            # The old thread winds down in the background; the new loader doesn't wait for it
+            self._retire_thread(self.tag_thread, self.tag_worker)
             self.tag_thread = None
             self.tag_worker = None
         
-        input_dir_path = Path(self.settings.paths.input_dir)
+        input_dir_path = self._input_dir_path()
         if not input_dir_path.is_dir():
             return
 
@@ -354,7 +469,7 @@ class MainWindow(QMainWindow):
             self._clear_image_display()
             return
 
-        image_path = Path(self.settings.paths.input_dir) / item.data(Qt.ItemDataRole.UserRole + 1)
+        image_path = self._input_dir_path() / self._item_relpath(item)
         
         if not image_path.is_file():
             self._clear_image_display()
@@ -362,19 +477,21 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            image = QImage(str(image_path))
-            if image.isNull():
-                raise ValueError("Failed to load QImage")
-            
-            pixmap = QPixmap.fromImage(image)
+            cache_key = f"{image_path}|{os.stat(image_path).st_mtime_ns}"
+            pixmap = self._pixmap_cache.get(cache_key)
+            if pixmap is not None:
+                self._pixmap_cache.move_to_end(cache_key)
+            else:
+                # Decoding straight into a QPixmap skips the intermediate QImage and its conversion copy
+                pixmap = QPixmap(str(image_path))
+                if pixmap.isNull():
+                    raise ValueError("Failed to load QPixmap")
+                self._pixmap_cache[cache_key] = pixmap
+                if len(self._pixmap_cache) > IMAGE_PIXMAP_CACHE_SIZE:
+                    self._pixmap_cache.popitem(last=False)
             self._original_image_pixmap = pixmap
-            
-            scaled_pixmap = pixmap.scaled(
-                self.image_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap)
+            self._last_scaled_state = None  # The label may have been cleared since; always draw
+            self._rescale_current_pixmap()
             
             self._load_image_tags(image_path)
             
@@ -385,17 +502,75 @@ class MainWindow(QMainWindow):
             self._clear_image_display()
             self.image_label.setText(self.locale_manager.get_string("MainWindow", "Image_Display_Error", image_relative_path=image_path.name, e=e))
 
+    def _rescale_current_pixmap(self, smooth: bool = True):
+        """
+        Fits the in-memory original image to the current label size. smooth=False is the
+        cheap preview used while a resize is in progress; the debounced handler follows up
+        with a smooth pass.
+        """
+        original = self._original_image_pixmap
+        if original is None or original.isNull():
+            return
+        size = self.image_label.size()
+        key, w, h = original.cacheKey(), size.width(), size.height()
+        last = self._last_scaled_state
+        # Skip when (nearly) this size is already shown at the requested quality or better
+        if (last is not None and last[0] == key and (last[3] or not smooth)
+                and abs(last[1] - w) < RESIZE_TOLERANCE_PX and abs(last[2] - h) < RESIZE_TOLERANCE_PX):
+            return
+        scaled_pixmap = original.scaled(
+            size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation if smooth else Qt.TransformationMode.FastTransformation
+        )
+        self.image_label.setPixmap(scaled_pixmap)
+        self._last_scaled_state = (key, w, h, smooth)
+
+    def _read_tag_file(self, txt_path: Path) -> list[str]:
+        """
+        Returns the tags in txt_path as a new list, parsing the file only when its mtime/size changed
+        since the last read or write. Raises FileNotFoundError if the file doesn't exist.
+        """
+        st = os.stat(txt_path)
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = self._tag_file_cache.get(txt_path)
+        if cached is not None and cached[0] == signature:
+            self._tag_file_cache.move_to_end(txt_path)
+            return list(cached[1])
+        with open(txt_path, 'rb') as f:
+            tags = list(filter(None, map(str.strip, f.read().decode('utf-8').split(','))))
+        self._remember_tag_file(txt_path, signature, tags)
+        return list(tags)
+
+    def _write_tag_file(self, txt_path: Path, tags: list[str]):
+        """Writes tags to txt_path and keeps the parsed copy, so the following reload doesn't re-read it."""
+        txt_path.write_text(', '.join(tags), 'utf-8')
+        st = os.stat(txt_path)
+        self._remember_tag_file(txt_path, (st.st_mtime_ns, st.st_size), list(tags))
+
+    def _remember_tag_file(self, txt_path: Path, signature: tuple[int, int], tags: list[str]):
+        self._tag_file_cache[txt_path] = (signature, tags)
+        self._tag_file_cache.move_to_end(txt_path)
+        if len(self._tag_file_cache) > TAG_FILE_CACHE_SIZE:
+            self._tag_file_cache.popitem(last=False)
+
     def _load_image_tags(self, image_path: Path, preserve_page: bool = False):
         """Loads tags from the corresponding .txt file for a given image."""
         txt_path = image_path.with_suffix('.txt')
-        tag_content = ""
-        if txt_path.is_file():
-            try:
-                tag_content = txt_path.read_text(encoding='utf-8').strip()
-            except Exception as e:
-                self.update_log(self.locale_manager.get_string("MainWindow", "Error_Tag_File_Load_Failed", e=e, txt_path_name=txt_path.name), "red")
+        tags: list[str] = []
+        try:
+            # A missing sidecar just means no tags
+            tags = self._read_tag_file(txt_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.update_log(self.locale_manager.get_string("MainWindow", "Error_Tag_File_Load_Failed", e=e, txt_path_name=txt_path.name), "red")
         
-        self._current_image_tags = [tag.strip() for tag in tag_content.split(',') if tag.strip()]
+        self._load_image_tags_from_list(tags, preserve_page)
+
+    def _load_image_tags_from_list(self, tags: list[str], preserve_page: bool = False):
+        """Shows tags already in memory (e.g. the list just written to the .txt) for the selected image."""
+        self._set_current_image_tags(tags)
         
         if preserve_page:
             # タグ数変化に応じてページ番号をクランプする
@@ -411,7 +586,8 @@ class MainWindow(QMainWindow):
         self.image_label.clear()
         self.image_label.setText(self.locale_manager.get_string("MainWindow", "Image_Not_Selected"))
         self._original_image_pixmap = None
-        self._current_image_tags = []
+        self._last_scaled_state = None
+        self._set_current_image_tags([])
         self._current_image_tag_page = 0
         self._display_image_tag_page()
         if self._image_viewer_dialog:
@@ -423,11 +599,11 @@ class MainWindow(QMainWindow):
             self.loading_timer.stop()
         self._is_bulk_deleting = False
         self._all_tags = all_tags
+        self._total_tag_pages = max(1, (len(all_tags) + constants.TAGS_PER_PAGE - 1) // constants.TAGS_PER_PAGE)
 
         saved_page = getattr(self, '_saved_bulk_page', None)
         if saved_page is not None:
-            total_pages = max(1, (len(all_tags) + constants.TAGS_PER_PAGE - 1) // constants.TAGS_PER_PAGE)
-            self._current_page = min(saved_page, total_pages - 1)
+            self._current_page = min(saved_page, self._total_tag_pages - 1)
         else:
             self._current_page = 0
         self._saved_bulk_page = None
@@ -435,14 +611,19 @@ class MainWindow(QMainWindow):
         self.display_current_tag_page()
         self._build_tag_cache()
 
+    def _set_current_image_tags(self, tags: list[str]):
+        """Replaces the selected image's tags and recomputes its page count."""
+        self._current_image_tags = tags
+        tags_per_page = self._image_tags_per_page
+        self._total_image_tag_pages = max(1, (len(tags) + tags_per_page - 1) // tags_per_page)
+
     def _get_image_tags_per_page(self) -> int:
         """Returns the number of tags to display per page for the current image."""
-        return max(1, self.settings.window.tag_display_cols * self.settings.window.tag_display_rows)
+        return self._image_tags_per_page
 
     def _get_total_image_tag_pages(self) -> int:
         """Returns the total number of tag pages for the current image."""
-        tags_per_page = self._get_image_tags_per_page()
-        return max(1, (len(self._current_image_tags) + tags_per_page - 1) // tags_per_page)
+        return self._total_image_tag_pages
 
     # ヘルパーメソッドを追加（クラス内に追加してください）
     def _get_translation_index(self, language: str) -> int:
@@ -459,12 +640,54 @@ class MainWindow(QMainWindow):
         }
         return lang_map.get(language, -1)
 
+    def _translate_tag_names(self, tag_names: list[str]) -> list[str]:
+        """Returns the display text for each tag in the current display language, resolved in one pass (English tags pass through)."""
+        lang_index = self._get_translation_index(self._tag_display_language)
+        if lang_index == -1:
+            return tag_names
+        translation_get = self.tag_translation_map.get
+        # 翻訳が無い、またはその言語の訳が無い場合は英語のまま
+        return [
+            translations[lang_index]
+            if (translations := translation_get(tag_name)) is not None and len(translations) > lang_index
+            else tag_name
+            for tag_name in tag_names
+        ]
+
+    def _grow_tag_button_pool(self, pool: list[QPushButton], size: int, on_clicked: Callable[[], None]) -> bool:
+        """Appends hidden buttons to pool until it holds size. Returns True if any were created."""
+        grew = len(pool) < size
+        while len(pool) < size:
+            button = QPushButton()
+            # Connected once; the slot reads the tag from the button's "original_tag" property
+            button.clicked.connect(on_clicked)
+            button.installEventFilter(self)
+            button.hide()
+            pool.append(button)
+        return grew
+
+    @Slot()
+    def _on_bulk_tag_button_clicked(self):
+        tag_name = self.sender().property("original_tag")
+        if tag_name:
+            self.delete_tag_all(tag_name)
+
+    @Slot()
+    def _on_image_tag_button_clicked(self):
+        tag_name = self.sender().property("original_tag")
+        if tag_name:
+            self._delete_image_tag(tag_name)
+
     def display_current_tag_page(self):
         """Displays the current page of bulk tags."""
-        for button in self.tag_buttons:
-            button.deleteLater()
-        self.tag_buttons.clear()
-
+        if self._grow_tag_button_pool(self.tag_buttons, constants.TAGS_PER_PAGE, self._on_bulk_tag_button_clicked):
+            min_w, min_h, grid_add = self._tag_button_min_width, self._tag_button_min_height, self.tag_button_grid.addWidget
+            for i, button in enumerate(self.tag_buttons):
+                button.setMinimumWidth(min_w)
+                button.setFixedHeight(min_h)
+                grid_add(button, i // 4, i % 4)
+
+        shown = 0
         total_tags = len(self._all_tags)
         start_index = self._current_page * constants.TAGS_PER_PAGE
         end_index = min(start_index + constants.TAGS_PER_PAGE, total_tags)
@@ -475,78 +698,55 @@ class MainWindow(QMainWindow):
             self.loading_label.setText(self.locale_manager.get_string("MainWindow", "Displaying_Tags_Count_And_Click_Delete", total_tags=total_tags, start_index=start_index + 1, end_index=end_index))
             
             current_page_tags = self._all_tags[start_index:end_index]
-            
-            # 翻訳リストのインデックスを取得
-            lang_index = self._get_translation_index(self._tag_display_language)
+            display_texts = self._translate_tag_names([tag_name for tag_name, _ in current_page_tags])
+            buttons = self.tag_buttons
 
-            for i, (tag_name, count) in enumerate(current_page_tags):
-                display_text = tag_name
-                
-                # 英語以外かつ、辞書にタグが存在する場合
-                if lang_index != -1 and tag_name in self.tag_translation_map:
-                    try:
-                        # 指定した言語の翻訳を取得
-                        translations = self.tag_translation_map[tag_name]
-                        if len(translations) > lang_index:
-                            display_text = translations[lang_index]
-                    except IndexError:
-                        pass # エラー時は英語のまま
-
-                button = QPushButton(f"{display_text} ({count})")
-                # ... (以下のコードはそのまま) ...
-                button.setMinimumWidth(self._tag_button_min_width)
-                button.setFixedHeight(self._tag_button_min_height)
+            for i, ((tag_name, count), display_text) in enumerate(zip(current_page_tags, display_texts)):
+                button = buttons[i]
+                button.setText(f"{display_text} ({count})")
                 button.setToolTip(tag_name) # Tooltip always shows English tag
                 button.setProperty("original_tag", tag_name)
-                button.clicked.connect(functools.partial(self.delete_tag_all, tag_name))
-                button.installEventFilter(self)
-                self.tag_button_grid.addWidget(button, i // 4, i % 4)
-                self.tag_buttons.append(button)
+                button.show()
+            shown = len(current_page_tags)
+        for button in self.tag_buttons[shown:]:
+            button.hide()
 
         self.prev_page_btn.setEnabled(self._current_page > 0)
         self.next_page_btn.setEnabled(end_index < total_tags)
         self._set_bulk_controls_enabled(True)
-        QTimer.singleShot(0, self.update_all_button_alignments)
+        self._align_timer.start()
         
     def _display_image_tag_page(self):
         """Displays the current page of tags for the selected image."""
-        for button in self.tag_buttons_for_image:
-            button.deleteLater()
-        self.tag_buttons_for_image.clear()
-
         cols = self.settings.window.tag_display_cols
         tags_per_page = self._get_image_tags_per_page()
+        pool = self.tag_buttons_for_image
+        if self._grow_tag_button_pool(pool, tags_per_page, self._on_image_tag_button_clicked) or cols != self._image_tag_grid_cols:
+            # Lay the whole pool out again for new buttons or a changed column count
+            min_w, min_h, grid_add = self._tag_button_min_width, self._tag_button_min_height, self.tag_display_grid.addWidget
+            for i, button in enumerate(pool):
+                button.setMinimumSize(min_w, min_h)
+                grid_add(button, i // cols, i % cols)
+            self._image_tag_grid_cols = cols
 
         total_tags = len(self._current_image_tags)
         start = self._current_image_tag_page * tags_per_page
         end = min(start + tags_per_page, total_tags)
         
-        lang_index = self._get_translation_index(self._tag_display_language)
-
-        for i, tag_name in enumerate(self._current_image_tags[start:end]):
-            display_text = tag_name
-            
-            # 翻訳処理
-            if lang_index != -1 and tag_name in self.tag_translation_map:
-                try:
-                    translations = self.tag_translation_map[tag_name]
-                    if len(translations) > lang_index:
-                        display_text = translations[lang_index]
-                except IndexError:
-                    pass
-
-            button = QPushButton(display_text)
-            button.setMinimumSize(self._tag_button_min_width, self._tag_button_min_height)
+        page_tags = self._current_image_tags[start:end]
+        display_texts = self._translate_tag_names(page_tags)
+        for i, (tag_name, display_text) in enumerate(zip(page_tags, display_texts)):
+            button = pool[i]
+            button.setText(display_text)
             button.setToolTip(tag_name) # Tooltip always shows English tag
             button.setProperty("original_tag", tag_name)
-            button.clicked.connect(functools.partial(self._delete_image_tag, tag_name))
-            button.installEventFilter(self)
-            self.tag_display_grid.addWidget(button, i // cols, i % cols)
-            self.tag_buttons_for_image.append(button)
+            button.show()
+        for button in pool[len(page_tags):]:
+            button.hide()
 
         self.image_tag_prev_page_btn.setEnabled(self._current_image_tag_page > 0)
         self.image_tag_next_page_btn.setEnabled(end < total_tags)
-        QTimer.singleShot(0, self.update_all_button_alignments)
+        self._align_timer.start()
 
     @Slot(int)
     def toggle_tag_language(self, index: int):
@@ -595,13 +795,15 @@ class MainWindow(QMainWindow):
         """Handles the window closing event to save settings and stop threads gracefully."""
         self._is_shutting_down = True
         write_debug_log("DEBUG: closeEvent triggered. _is_shutting_down = True")
-        self.save_current_config()
+        self._save_config_now()
 
         threads_to_stop: list[tuple[QThread | None, StoppableWorker | None]] = [ # type: ignore
             (self._download_thread, self._downloader_worker),
             (self._tagger_thread, self._tagger_worker),
             (self._bulk_tag_thread, self._bulk_tag_worker),
-            (self.tag_thread, self.tag_worker)
+            (self.tag_thread, self.tag_worker),
+            (self._translation_thread, self._translation_loader),
+            *self._retiring_threads
         ]
 
         # First, request all running threads to stop by calling their thread-safe stop() method
@@ -617,12 +819,18 @@ class MainWindow(QMainWindow):
                 write_debug_log(f"DEBUG: closeEvent: Calling quit() on thread {thread}.")
                 thread.quit()
 
-        # Now, wait for them to finish
+        # A tagger waiting on an overwrite answer would never see stop(); release it (unanswered means skip)
+        self._overwrite_reply_event.set()
+
+        # Now, wait for them to finish. They were all told to stop above and wind down in
+        # parallel, so the waits share one 5 second deadline rather than 5 seconds each.
+        deadline = time.monotonic() + 5.0
         for thread, worker in threads_to_stop:
             if thread and thread.isRunning():
                 write_debug_log(f"DEBUG: closeEvent: Waiting for thread {thread} to finish...")
-                # Wait up to 5 seconds. This blocks the GUI, which is acceptable on close.
-                if not thread.wait(5000):
+                # This blocks the GUI, which is acceptable on close.
+                remaining_ms = max(100, int((deadline - time.monotonic()) * 1000))
+                if not thread.wait(remaining_ms):
                     write_debug_log(f"ERROR: closeEvent: Thread {thread} did not finish gracefully, terminating.")
                     thread.terminate() # Last resort
                 else:
@@ -693,10 +901,43 @@ class MainWindow(QMainWindow):
     @Slot()
     def select_image_item(self, item: QListWidgetItem):
         write_debug_log(f"DEBUG: select_image_item - item: {item.text()}")
-        """Slot for when an item in the image list is clicked."""
+        """Clears tag highlights and shows the given image list item."""
         self._clear_highlight()
         self._load_and_fit_image(item)
 
+    @Slot(QListWidgetItem, QListWidgetItem)
+    def _on_current_image_changed(self, current: QListWidgetItem | None, previous: QListWidgetItem | None):
+        """Slot for image_list.currentItemChanged. A None current item (e.g. the list being cleared) is ignored."""
+        if current is None:
+            return
+        if self._navigating:
+            self._pending_nav_item = current
+            self._nav_timer.start()
+        else:
+            self._nav_timer.stop()
+            self._pending_nav_item = None
+            if QApplication.mouseButtons() != Qt.MouseButton.NoButton:
+                # Selected by a mouse press; the itemClicked that follows must not load it a second time
+                self._press_selected_item = current
+            self.select_image_item(current)
+
+    @Slot(QListWidgetItem)
+    def _on_image_item_clicked(self, item: QListWidgetItem):
+        """Slot for image_list.itemClicked. Re-selecting the current item reloads it (picks up external tag edits)."""
+        if item is not self._press_selected_item:
+            self.select_image_item(item)
+
+    @Slot()
+    def _on_image_list_mouse_released(self):
+        """Slot for image_list.mouse_released. Press and release on different rows emit no itemClicked, so reset here."""
+        self._press_selected_item = None
+
+    @Slot()
+    def _load_pending_nav_item(self):
+        item, self._pending_nav_item = self._pending_nav_item, None
+        if item is not None and item is self.image_list.currentItem():
+            self.select_image_item(item)
+
     @Slot(str, str)
     def _handle_folder_drop(self, folder_path: str, file_to_select: str | None = None):
         write_debug_log(f"DEBUG: _handle_folder_drop - folder_path: {folder_path}, file_to_select: {file_to_select}")
@@ -756,39 +997,70 @@ class MainWindow(QMainWindow):
 
     def resizeEvent(self, event: QResizeEvent):
         write_debug_log(f"DEBUG: resizeEvent - size: {event.size().width()}x{event.size().height()}")
-        """Starts a timer to handle resizing after it has finished."""
+        """Shows a fast-scaled preview and starts a timer for the smooth rescale once resizing settles."""
+        if self._original_image_pixmap is not None:
+            self._rescale_current_pixmap(smooth=False)
         self._resize_timer.start()
         super().resizeEvent(event)
 
     @Slot()
     def _handle_resize_debounced(self):
         write_debug_log("DEBUG: _handle_resize_debounced called.")
-        """Reloads the currently displayed image to fit the new window size."""
+        """Rescales the currently displayed image to fit the new window size."""
         current_item = self.image_list.currentItem()
         if current_item and self.image_label.pixmap():
-            self._load_and_fit_image(current_item)
-        self.update_all_button_alignments()
+            self._rescale_current_pixmap()
+        size, last = self.size(), self._last_aligned_size
+        if (last is not None and abs(size.width() - last.width()) < RESIZE_TOLERANCE_PX
+                and abs(size.height() - last.height()) < RESIZE_TOLERANCE_PX):
+            return
+        self._last_aligned_size = size
+        self._align_timer.start()
 
-    def update_button_text_alignment(self, button: QPushButton):
+    def update_button_text_alignment(self, button: QPushButton, font_metrics: QFontMetrics | None = None):
         # write_debug_log(f"DEBUG: update_button_text_alignment - button text: {button.text()}")
-        font_metrics = button.fontMetrics()
-        text_width = font_metrics.horizontalAdvance(button.text())
+        text = button.text()
+        if font_metrics is None:
+            text_width = button.fontMetrics().horizontalAdvance(text)
+        else:
+            # Shared metrics come from update_all_button_alignments, which keeps the width memo in step with the font
+            text_width = self._text_width_cache.get(text)
+            if text_width is None:
+                text_width = font_metrics.horizontalAdvance(text)
+                if len(self._text_width_cache) >= TEXT_WIDTH_CACHE_SIZE:
+                    self._text_width_cache.clear()
+                self._text_width_cache[text] = text_width
         
         button_text_space = button.contentsRect().width()
 
-        if text_width > button_text_space:
-            button.setStyleSheet("QPushButton { text-align: left; padding-left: 5px; }")
-        else:
-            button.setStyleSheet("QPushButton { text-align: center; }")
+        # The alignment rules live in the main view's stylesheet (STYLE_TAG_BUTTON_ALIGNMENT);
+        # flipping the property only needs a re-polish, and only when it actually changes
+        align_left = text_width > button_text_space
+        if button.property("alignLeft") == align_left:
+            return
+        button.setProperty("alignLeft", align_left)
+        style = button.style()
+        style.unpolish(button)
+        style.polish(button)
 
+    @Slot()
     def update_all_button_alignments(self):
+        """Re-aligns every shown tag button. Callers go through _align_timer so bursts collapse into one pass."""
         write_debug_log("DEBUG: update_all_button_alignments called.")
-        for button in self.tag_buttons:
-            if button.isVisible():
-                self.update_button_text_alignment(button)
-        for button in self.tag_buttons_for_image:
-            if button.isVisible():
-                self.update_button_text_alignment(button)
+        # All tag buttons share the application font, so one metrics probe serves every button
+        font_metrics: QFontMetrics | None = None
+        update_alignment = self.update_button_text_alignment
+        for pool in (self.tag_buttons, self.tag_buttons_for_image):
+            for button in pool:
+                # isVisibleTo(self) stops at the window instead of also checking the window's own visibility
+                if button.isVisibleTo(self):
+                    if font_metrics is None:
+                        font_metrics = button.fontMetrics()
+                        font_key = button.font().key()
+                        if font_key != self._text_width_font_key:
+                            self._text_width_cache.clear()
+                            self._text_width_font_key = font_key
+                    update_alignment(button, font_metrics)
 
 
     def navigate_image_list(self, delta: int):
@@ -797,24 +1069,24 @@ class MainWindow(QMainWindow):
         current = self.image_list.currentRow()
         new_row = current + delta
         if 0 <= new_row < self.image_list.count():
-            item = self.image_list.item(new_row)
-            self.image_list.setCurrentItem(item)
-            self._clear_highlight()
-            self._load_and_fit_image(item)
+            # currentItemChanged -> _on_current_image_changed loads the image once navigation pauses
+            self._navigating = True
+            try:
+                self.image_list.setCurrentItem(self.image_list.item(new_row))
+            finally:
+                self._navigating = False
 
     def _change_tag_page(self, delta: int):
         """Changes the displayed page for bulk tags."""
         new_page = self._current_page + delta
-        total_pages = (len(self._all_tags) + constants.TAGS_PER_PAGE - 1) // constants.TAGS_PER_PAGE
-        if 0 <= new_page < total_pages:
+        if 0 <= new_page < self._total_tag_pages:
             self._current_page = new_page
             self.display_current_tag_page()
 
     def _change_image_tag_page(self, delta: int):
         """Changes the displayed page for single image tags."""
         new_page = self._current_image_tag_page + delta
-        total_pages = self._get_total_image_tag_pages()
-        if 0 <= new_page < total_pages:
+        if 0 <= new_page < self._total_image_tag_pages:
             self._current_image_tag_page = new_page
             self._display_image_tag_page()
 
@@ -829,43 +1101,41 @@ class MainWindow(QMainWindow):
         if not tags_raw:
             return
 
-        # (Normalization logic for full-width chars, spaces, commas...)
-        tags_processed = ' '.join(tags_raw.replace('ã€€', ' ').split())
-        while ',,' in tags_processed:
-            tags_processed = tags_processed.replace(',,', ',')
-        new_tags = [t.strip() for t in tags_processed.split(',') if t.strip()]
+        # Normalize full-width/collapsed spaces and repeated commas in one scan each
+        tags_processed = _TAG_INPUT_WHITESPACE_RE.sub(' ', tags_raw)
+        new_tags = list(filter(None, map(str.strip, _TAG_INPUT_SEPARATOR_RE.split(tags_processed))))
         if not new_tags:
             return
 
-        image_path = Path(self.settings.paths.input_dir) / current_item.data(Qt.ItemDataRole.UserRole + 1)
+        image_path = self._input_dir_path() / self._item_relpath(current_item)
         txt_path = image_path.with_suffix('.txt')
 
         try:
-            existing_tags = []
+            existing_tags: list[str] = []
             if txt_path.is_file():
-                existing_tags = [t.strip() for t in txt_path.read_text('utf-8').split(',') if t.strip()]
+                existing_tags = self._read_tag_file(txt_path)
             
-            # Filter out tags that already exist
-            tags_to_add = [tag for tag in new_tags if tag not in existing_tags]
+            # Filter out tags that already exist (a set keeps this linear; add() also drops repeats within the input)
+            existing_set = set(existing_tags)
+            tags_to_add = [tag for tag in new_tags if tag not in existing_set and not existing_set.add(tag)]
             
             if not tags_to_add:
                 self.update_log(self.locale_manager.get_string("MainWindow", "Tag_Already_Exists"), "orange")
                 return
             
-            for tag in tags_to_add:
-                existing_tags.append(tag)
+            existing_tags.extend(tags_to_add)
             
-            txt_path.write_text(', '.join(existing_tags), 'utf-8')
+            self._write_tag_file(txt_path, existing_tags)
             
             # Record action for undo
             action = AddTagsAction(file_path=txt_path, added_tags=tags_to_add)
             self.undo_manager.push(action)
-            self._update_undo_redo_buttons()
+            self._schedule_undo_refresh()
             
             self.update_log(self.locale_manager.get_string("MainWindow", "Tags_Added_To_File", txt_path_name=txt_path.name), "green")
             self.add_single_tag_line.clear()
-            self._load_image_tags(image_path, preserve_page=True)
-            rel_path = current_item.data(Qt.ItemDataRole.UserRole + 1)
+            self._load_image_tags_from_list(existing_tags, preserve_page=True) # Just written; no need to read it back
+            rel_path = self._item_relpath(current_item)
             self._update_tag_cache_entry(rel_path)
             self.reload_tags_only()
         except Exception as e:
@@ -879,7 +1149,7 @@ class MainWindow(QMainWindow):
             write_debug_log("[_delete_image_tag] No image item selected.")
             return
 
-        image_path = Path(self.settings.paths.input_dir) / current_item.data(Qt.ItemDataRole.UserRole + 1)
+        image_path = self._input_dir_path() / self._item_relpath(current_item)
         txt_path = image_path.with_suffix('.txt')
         
         write_debug_log(f"[_delete_image_tag] Image path: {image_path}, TXT path: {txt_path}")
@@ -889,26 +1159,29 @@ class MainWindow(QMainWindow):
             return
         
         try:
-            tags = [t.strip() for t in txt_path.read_text('utf-8').split(',') if t.strip()]
+            tags = self._read_tag_file(txt_path)
             write_debug_log(f"[_delete_image_tag] Existing tags before deletion: {tags}")
 
-            if tag_to_delete in tags:
-                # Record original index for undo
+            # One scan finds the tag and its original index (for undo) together
+            try:
                 original_index = tags.index(tag_to_delete)
-                
-                tags.remove(tag_to_delete)
+            except ValueError:
+                original_index = -1
+
+            if original_index != -1:
+                del tags[original_index]
                 write_debug_log(f"[_delete_image_tag] Tags after removal: {tags}")
-                txt_path.write_text(', '.join(tags), 'utf-8')
+                self._write_tag_file(txt_path, tags)
                 write_debug_log(f"[_delete_image_tag] Successfully wrote tags to file: {txt_path.name}")
                 
                 # Record action for undo
                 action = RemoveTagAction(file_path=txt_path, removed_tag=tag_to_delete, original_index=original_index)
                 self.undo_manager.push(action)
-                self._update_undo_redo_buttons()
+                self._schedule_undo_refresh()
                 
                 self.update_log(self.locale_manager.get_string("MainWindow", "Tag_Deleted_From_File", tag_name=tag_to_delete, file_name=txt_path.name), "green")
-                self._load_image_tags(image_path, preserve_page=True)
-                rel_path = current_item.data(Qt.ItemDataRole.UserRole + 1)
+                self._load_image_tags_from_list(tags, preserve_page=True) # Just written; no need to read it back
+                rel_path = self._item_relpath(current_item)
                 self._update_tag_cache_entry(rel_path)
                 write_debug_log("[_delete_image_tag] UI updated after tag deletion.")
             else:
@@ -932,21 +1205,22 @@ class MainWindow(QMainWindow):
             return
         
         if QMessageBox.question(self, self.locale_manager.get_string("MainWindow", "Bulk_Add_Confirmation"), self.locale_manager.get_string("MainWindow", "Confirm_Bulk_Add_Tag", tags_to_add=tags_to_add)) == QMessageBox.StandardButton.Yes:
-            self._start_bulk_tag_worker('add', input_dir=Path(self.settings.paths.input_dir), tags=tags_to_add, prepend=prepend)
+            self._start_bulk_tag_worker('add', input_dir=self._input_dir_path(), tags=tags_to_add, prepend=prepend)
     
     def delete_tag_all(self, tag_to_delete: str):
         """Starts a bulk process to delete a tag from all .txt files."""
         if self._is_bulk_deleting:
             return
         if QMessageBox.question(self, self.locale_manager.get_string("MainWindow", "Bulk_Delete_Confirmation"), self.locale_manager.get_string("MainWindow", "Confirm_Bulk_Delete_Tag", tag_to_delete=tag_to_delete)) == QMessageBox.StandardButton.Yes:
-            self._start_bulk_tag_worker('delete', input_dir=Path(self.settings.paths.input_dir), tag=tag_to_delete)
+            self._start_bulk_tag_worker('delete', input_dir=self._input_dir_path(), tag=tag_to_delete)
 
     # --- Thread and Process Management ---
 
     def toggle_download_or_start_tagging(self):
         """Main action button logic: starts or stops download/tagging."""
         self.update_log(self.locale_manager.get_string("MainWindow", "Starting_Process_Generic"), "black")
-        QApplication.processEvents() # Ensure the log message is displayed immediately
+        # Paint the log now without dispatching other pending events (processEvents could re-enter this handler)
+        self.log_output.repaint()
         if self._is_downloading:
             self._stop_download_thread()
         elif self._tagger_thread and self._tagger_thread.isRunning():
@@ -976,8 +1250,8 @@ class MainWindow(QMainWindow):
         selected_path: Path | None = None
         current_item = self.image_list.currentItem()
         if current_item:
-            relative_path = current_item.data(Qt.ItemDataRole.UserRole + 1)
-            selected_path = Path(self.settings.paths.input_dir) / relative_path
+            relative_path = self._item_relpath(current_item)
+            selected_path = self._input_dir_path() / relative_path
 
         self._tagger_thread = QThread()
         self._tagger_worker = TaggerThreadWorker(self.settings, self._show_overwrite_dialog, self.locale_manager.get_string, selected_file_path=selected_path)
@@ -993,16 +1267,35 @@ class MainWindow(QMainWindow):
     def _cleanup_tagger_thread(self):
         """Safely cleans up the existing tagger thread and worker."""
         if self._tagger_thread:
-            if self._tagger_thread.isRunning():
-                # This should not happen if called from _start_tagging_thread, but as a safeguard:
-                self._tagger_thread.quit()
-                self.update_log(self.locale_manager.get_string("MainWindow", "Waiting_For_Thread_To_Finish"), "orange")
-                self._tagger_thread.wait(1000) # Wait a bit
-            self._tagger_thread.deleteLater()
-            self._tagger_thread = None
-        if self._tagger_worker:
+            self._retire_thread(self._tagger_thread, self._tagger_worker)
+        elif self._tagger_worker:
             self._tagger_worker.deleteLater()
-            self._tagger_worker = None
+        self._tagger_thread = self._tagger_worker = None
+
+    def _retire_thread(self, thread: QThread, worker: QObject | None):
+        """
+        Quits thread without blocking the GUI. The thread and its worker stay referenced in
+        _retiring_threads until the thread has actually finished, then both are deleteLater()'d.
+        """
+        self._retiring_threads.append((thread, worker))
+        thread.finished.connect(self._on_retired_thread_finished)
+        thread.quit()
+        if not thread.isRunning():
+            # Never started or already stopped: finished may not be emitted (again)
+            self._release_retired_thread(thread)
+
+    @Slot()
+    def _on_retired_thread_finished(self):
+        self._release_retired_thread(self.sender())
+
+    def _release_retired_thread(self, thread: QObject):
+        for i, (retiring_thread, worker) in enumerate(self._retiring_threads):
+            if retiring_thread is thread:
+                del self._retiring_threads[i]
+                if worker:
+                    worker.deleteLater()
+                retiring_thread.deleteLater()
+                return
 
     def _stop_tagging_thread(self):
         """Requests the tagging thread to stop."""
@@ -1010,8 +1303,7 @@ class MainWindow(QMainWindow):
             self.update_log(self.locale_manager.get_string("MainWindow", "Stopping_Tagging_Process"), "orange")
             self.run_button.setText(self.locale_manager.get_string("Constants", "Stopping_Process"))
             self.run_button.setEnabled(False)
-            self._tagger_worker.stop()
-            QApplication.processEvents() # Ensure UI remains responsive during stop
+            self._tagger_worker.stop() # Non-blocking; _on_tagger_finished runs once the worker has wound down
 
     def _start_download_thread(self):
         """Initializes and starts the DownloaderWorker."""
@@ -1076,7 +1368,7 @@ class MainWindow(QMainWindow):
         path_to_reselect = None
         if current_item:
             # Store the relative path of the current file to re-select it later
-            path_to_reselect = current_item.data(Qt.ItemDataRole.UserRole + 1)
+            path_to_reselect = self._item_relpath(current_item)
 
         self.reload_image_list(auto_select_path=path_to_reselect)
         self.reload_tags_only()
@@ -1098,30 +1390,51 @@ class MainWindow(QMainWindow):
         if success:
             self.update_log(self.locale_manager.get_string("MainWindow", "Model_Download_Complete"), "green")
             # Update only the model verification status without overwriting user-modified settings
-            config = load_config()
-            self.settings.model.verified = config.getboolean('Model', 'verified', fallback=False)
+            self.settings.model.verified = load_settings(load_config()).model.verified
             self._check_model_status_and_update_ui() # On success, check status to show "TAG" button
             
-            # Reload tag translation map as files are now available
-            self.tag_translation_map = load_tag_translation_map(constants.TAGS_CSV_PATH, constants.TAGS_JP_CSV_PATH, constants.TAGS_FR_CSV_PATH, constants.TAGS_DE_CSV_PATH, 
-                                                               constants.TAGS_ES_CSV_PATH, constants.TAGS_RU_CSV_PATH, constants.TAGS_ZH_CN_CSV_PATH, constants.TAGS_ZH_TW_CSV_PATH, constants.TAGS_KO_CSV_PATH)
-            
-            # Update UI with new translation map
-            self.display_current_tag_page()
-            self._display_image_tag_page()
-            self.grid_view_widget.set_tag_display_language(self._tag_display_language, self.tag_translation_map)
+            # Reload tag translation map as files are now available (the UI updates once it is loaded)
+            self._start_translation_map_load()
         else:
             self.update_log(self.locale_manager.get_string("MainWindow", "Model_Download_Failed"), "red")
             self._check_model_status_and_update_ui(force_download=True) # On failure/stop, force "Download" button
             
         if self._download_thread:
-            self._download_thread.quit()
-            self._download_thread.wait()
-            if self._downloader_worker:
-                self._downloader_worker.deleteLater()
-            self._download_thread.deleteLater()
+            self._retire_thread(self._download_thread, self._downloader_worker)
             self._download_thread = self._downloader_worker = None
 
+    def _start_translation_map_load(self):
+        """Loads the tag translation map on a worker thread."""
+        if self._translation_thread and self._translation_thread.isRunning():
+            return
+        self._translation_thread = QThread()
+        self._translation_loader = TranslationMapLoader()
+        self._translation_loader.moveToThread(self._translation_thread)
+        self._translation_thread.started.connect(self._translation_loader.run)
+        self._translation_loader.map_loaded.connect(self._on_translation_map_loaded)
+        self._translation_loader.finished.connect(self._on_translation_map_loader_finished)
+        self._translation_thread.start()
+
+    @Slot(object)
+    def _on_translation_map_loaded(self, translation_map: dict[str, list[str]]):
+        """Applies a freshly loaded translation map to every tag display."""
+        if self._is_shutting_down:
+            return
+        self.tag_translation_map = translation_map
+        self.display_current_tag_page()
+        self._display_image_tag_page()
+        self.grid_view_widget.set_tag_display_language(self._tag_display_language, self.tag_translation_map)
+
+    @Slot()
+    def _on_translation_map_loader_finished(self):
+        """Cleans up after the translation map loader thread has finished."""
+        if self._is_shutting_down:
+            return
+
+        if self._translation_thread:
+            self._retire_thread(self._translation_thread, self._translation_loader)
+            self._translation_thread = self._translation_loader = None
+
     @Slot()
     def _on_tag_loader_finished(self):
         """Cleans up after the tag loader thread has finished."""
@@ -1129,11 +1442,7 @@ class MainWindow(QMainWindow):
             return
 
         if self.tag_thread:
-            self.tag_thread.quit()
-            self.tag_thread.wait()
-            if self.tag_worker:
-                self.tag_worker.deleteLater()
-            self.tag_thread.deleteLater()
+            self._retire_thread(self.tag_thread, self.tag_worker)
             self.tag_thread = self.tag_worker = None
 
     @Slot()
@@ -1144,11 +1453,7 @@ class MainWindow(QMainWindow):
 
         self.reload_tags_only(preserve_page=True) # This will re-enable controls on finish
         if self._bulk_tag_thread:
-            self._bulk_tag_thread.quit()
-            self._bulk_tag_thread.wait()
-            if self._bulk_tag_worker:
-                self._bulk_tag_worker.deleteLater()
-            self._bulk_tag_thread.deleteLater()
+            self._retire_thread(self._bulk_tag_thread, self._bulk_tag_worker)
             self._bulk_tag_thread = self._bulk_tag_worker = None
     
     @Slot(list, list, str)
@@ -1157,8 +1462,8 @@ class MainWindow(QMainWindow):
         if file_paths:
             action = BulkAddTagsAction(file_paths=file_paths, added_tags=added_tags, position=position)
             self.undo_manager.push(action)
-            self._update_undo_redo_buttons()
-            input_dir = Path(self.settings.paths.input_dir)
+            self._schedule_undo_refresh()
+            input_dir = self._input_dir_path()
             for fp in file_paths:
                 rel_path = str(fp.relative_to(input_dir))
                 self._update_tag_cache_entry(rel_path)
@@ -1170,8 +1475,8 @@ class MainWindow(QMainWindow):
         if file_tag_positions:
             action = BulkRemoveTagsAction(removed_tag=removed_tag, file_tag_positions=file_tag_positions)
             self.undo_manager.push(action)
-            self._update_undo_redo_buttons()
-            input_dir = Path(self.settings.paths.input_dir)
+            self._schedule_undo_refresh()
+            input_dir = self._input_dir_path()
             for fp, _ in file_tag_positions:
                 rel_path = str(fp.relative_to(input_dir))
                 self._update_tag_cache_entry(rel_path)
@@ -1182,7 +1487,7 @@ class MainWindow(QMainWindow):
         """Records tag addition from GridView for undo."""
         action = AddTagsAction(file_path=file_path, added_tags=added_tags)
         self.undo_manager.push(action)
-        self._update_undo_redo_buttons()
+        self._schedule_undo_refresh()
         write_debug_log(f"GridView add action recorded: {len(added_tags)} tags to {file_path.name}")
         self._build_tag_cache()
         self.grid_view_widget.update_tag_cache(self._tag_cache)
@@ -1192,13 +1497,19 @@ class MainWindow(QMainWindow):
         """Records tag removal from GridView for undo."""
         action = RemoveTagAction(file_path=file_path, removed_tag=removed_tag, original_index=original_index)
         self.undo_manager.push(action)
-        self._update_undo_redo_buttons()
+        self._schedule_undo_refresh()
         write_debug_log(f"GridView remove action recorded: '{removed_tag}' from {file_path.name}")
         self._build_tag_cache()
         self.grid_view_widget.update_tag_cache(self._tag_cache)
 
    
 
+    @Slot()
+    def _save_config_now(self):
+        """Flushes a pending debounced save immediately (e.g. when a slider is released)."""
+        self._save_timer.stop()
+        self.save_current_config()
+
     def save_current_config(self):
         """Updates the settings object with the current UI state and saves it to file."""
         write_debug_log(self.locale_manager.get_string("MainWindow", "Saving_UI_Settings"))
@@ -1249,79 +1560,67 @@ class MainWindow(QMainWindow):
             value_label.setFixedWidth(50)
             self._sliders[f"{section.lower()}_{key}"] = (slider, value_label)
 
-            def update_value(value: int, k: str = key, s: Any = settings_section, res: float = resolution, v_label: QLabel = value_label, is_flt: bool = is_float):
-                real_val = value / res
-                v_label.setText(f"{real_val:.2f}" if is_flt else str(int(real_val)))
-                setattr(s, k, real_val if is_flt else int(real_val))
-                self.save_current_config() # Save settings whenever a slider value changes
-
-            slider.valueChanged.connect(update_value)
+            # Context for _on_slider_changed; one shared slot instead of a closure per slider
+            slider.setProperty("settings_section", section.lower())
+            slider.setProperty("settings_key", key)
+            slider.setProperty("resolution", float(resolution))
+            slider.setProperty("is_float", is_float)
+            slider.valueChanged.connect(self._on_slider_changed)
+            slider.sliderReleased.connect(self._save_config_now)
             
             layout.addWidget(label, row_index, 0)
             layout.addWidget(slider, row_index, 1)
             layout.addWidget(value_label, row_index, 2)
 
+    @Slot(int)
+    def _on_slider_changed(self, value: int):
+        """Shared valueChanged slot for the settings sliders; the target setting is read from the sender's properties."""
+        slider = self.sender()
+        section_name, key_name = slider.property("settings_section"), slider.property("settings_key")
+        is_float = slider.property("is_float")
+        real_val = value / slider.property("resolution")
+        self._sliders[f"{section_name}_{key_name}"][1].setText(f"{real_val:.2f}" if is_float else str(int(real_val)))
+        # Looked up each time, so the slider keeps following self.settings if it is replaced
+        setattr(getattr(self.settings, section_name), key_name, real_val if is_float else int(real_val))
+        self._save_timer.start() # Save once the value settles instead of on every drag step
+
     def _reconnect_sliders(self):
-        """Reconnects all sliders to the current self.settings object."""
+        """Syncs all sliders to the current self.settings object."""
         write_debug_log("Reconnecting sliders to the new settings object.")
+        # _on_slider_changed resolves self.settings on every change, so only the displayed values need updating
         for key, (slider, value_label) in self._sliders.items():
             try:
                 section_name, key_name = key.split('_', 1)
-                settings_section = getattr(self.settings, section_name)
-                initial_val = getattr(settings_section, key_name)
-                is_float = isinstance(initial_val, float)
-                resolution = 100.0 if is_float else 1.0
-
-                # Disconnect old connections to prevent multiple updates
-                slider.valueChanged.disconnect()
+                initial_val = getattr(getattr(self.settings, section_name), key_name)
+                is_float = slider.property("is_float")
 
-                # Update UI to reflect new settings
-                slider.setValue(int(initial_val * resolution))
+                slider.blockSignals(True)
+                slider.setValue(int(initial_val * slider.property("resolution")))
+                slider.blockSignals(False)
                 value_label.setText(f"{initial_val:.2f}" if is_float else str(int(initial_val)))
-
-                # Create and connect the new update function
-                def new_update_value(value: int, s: Any = settings_section, k: str = key_name, res: float = resolution,
-                                     v_label: QLabel = value_label, is_flt: bool = is_float):
-                    real_val = value / res
-                    v_label.setText(f"{real_val:.2f}" if is_flt else str(int(real_val)))
-                    setattr(s, k, real_val)
-
-                slider.valueChanged.connect(new_update_value)
             except Exception as e:
                 write_debug_log(f"Error reconnecting slider for '{key}': {e}")
 
     @Slot(str, str)
     def update_log(self, message: str, color: str = "black"):
         """Appends a colored, timestamped message to the log output."""
-        html_color = self._log_color_map.get(color, self._log_color_map["black"])
-        timestamp = datetime.now().strftime("[%H:%M:%S] ")
-        html_message = f'<span style="color:{html_color};">{timestamp}{message}</span>'
-        
-        self.log_output.append(html_message)
-
-        if self.log_output.document().blockCount() > constants.MAX_LOG_LINES:
-            cursor = self.log_output.textCursor()
-            cursor.movePosition(cursor.MoveOperation.Start)
-            cursor.movePosition(cursor.MoveOperation.NextBlock, cursor.MoveMode.KeepAnchor)
-            cursor.removeSelectedText()
-            cursor.deleteChar()
+        template = self._log_line_templates.get(color) or self._log_line_templates["black"]
+        # Only the prefix goes through strftime, so a '%' in message is never interpreted.
+        # Trimming to MAX_LOG_LINES is done by the document's maximumBlockCount (set in ui_main_window)
+        self.log_output.append(f'{time.strftime(template)}{message}</span>')
 
     def _build_tag_cache(self) -> None:
         """入力ディレクトリ内の全画像ファイルのタグキャッシュを構築する。"""
         self._tag_cache = {}
-        input_dir = Path(self.settings.paths.input_dir)
-        for i in range(self.image_list.count()):
-            item = self.image_list.item(i)
-            if item is None:
-                continue
-            rel_path = item.data(Qt.ItemDataRole.UserRole + 1)
+        input_dir = self._input_dir_path()
+        for rel_path in self._row_to_relpath:
             txt_path = (input_dir / rel_path).with_suffix('.txt')
             tags = tag_utils.read_tags(txt_path)
             self._tag_cache[rel_path] = set(tags)
 
     def _update_tag_cache_entry(self, rel_path: str) -> None:
         """指定ファイルのキャッシュエントリを更新する。"""
-        input_dir = Path(self.settings.paths.input_dir)
+        input_dir = self._input_dir_path()
         txt_path = (input_dir / rel_path).with_suffix('.txt')
         tags = tag_utils.read_tags(txt_path)
         self._tag_cache[rel_path] = set(tags)
@@ -1332,14 +1631,13 @@ class MainWindow(QMainWindow):
         color = QColor("#4a5a2a") if self._is_dark_theme else QColor("#c8f0a0")
         brush = QBrush(color)
         current_item = self.image_list.currentItem()
-        for i in range(self.image_list.count()):
+        for i, rel_path in enumerate(self._row_to_relpath):
+            if tag_name not in self._tag_cache.get(rel_path, ()):
+                continue
             item = self.image_list.item(i)
             if item is None or item is current_item:
                 continue
-            rel_path = item.data(Qt.ItemDataRole.UserRole + 1)
-            tags = self._tag_cache.get(rel_path, set())
-            if tag_name in tags:
-                item.setBackground(brush)
+            item.setBackground(brush)
 
     def _clear_highlight(self) -> None:
         """TagListWidgetの全アイテムのハイライトを解除する。"""
@@ -1350,8 +1648,17 @@ class MainWindow(QMainWindow):
             if item is not None:
                 item.setBackground(default_brush)
 
+    def _schedule_undo_refresh(self):
+        """Queues one _update_undo_redo_buttons for the next event loop pass; repeated calls before then are merged."""
+        if self._undo_refresh_pending:
+            return
+        self._undo_refresh_pending = True
+        QTimer.singleShot(0, self._update_undo_redo_buttons)
+
+    @Slot()
     def _update_undo_redo_buttons(self):
         """Updates the enabled state and tooltips of undo/redo buttons."""
+        self._undo_refresh_pending = False
         can_undo = self.undo_manager.can_undo()
         can_redo = self.undo_manager.can_redo()
         
@@ -1383,7 +1690,7 @@ class MainWindow(QMainWindow):
             self._refresh_ui_after_undo_redo()
         else:
             self.update_log(self.locale_manager.get_string("MainWindow", "Undo_Failed"), "red")
-        self._update_undo_redo_buttons()
+        self._schedule_undo_refresh()
     
     @Slot()
     def _perform_redo(self):
@@ -1393,14 +1700,14 @@ class MainWindow(QMainWindow):
             self._refresh_ui_after_undo_redo()
         else:
             self.update_log(self.locale_manager.get_string("MainWindow", "Redo_Failed"), "red")
-        self._update_undo_redo_buttons()
+        self._schedule_undo_refresh()
     
     def _refresh_ui_after_undo_redo(self):
         """Refreshes UI elements after undo/redo operations."""
         # Refresh current image tags (preserve page to avoid jumping back to page 0)
         current_item = self.image_list.currentItem()
         if current_item:
-            image_path = Path(self.settings.paths.input_dir) / current_item.data(Qt.ItemDataRole.UserRole + 1)
+            image_path = self._input_dir_path() / self._item_relpath(current_item)
             self._load_image_tags(image_path, preserve_page=True)
         
         # Rebuild tag cache to reflect undo/redo changes
@@ -1496,14 +1803,14 @@ class MainWindow(QMainWindow):
     @Slot()
     def _show_grid_view(self):
         """Switches the central widget to the GridViewWidget."""
-        image_paths = self._get_image_paths(Path(self.settings.paths.input_dir))
+        image_paths = self._get_image_paths(self._input_dir_path())
         if not image_paths:
             QMessageBox.information(self, self.locale_manager.get_string("MainWindow", "No_Images_Found_Title"), self.locale_manager.get_string("MainWindow", "No_Images_Found_Message"))
             return
 
         self.central_widget.setCurrentWidget(self.grid_view_widget)
         self.setWindowTitle(f"{constants.MSG_WINDOW_TITLE} - Grid View")
-        self.grid_view_widget.load_images(image_paths, self._tag_cache, Path(self.settings.paths.input_dir))
+        self.grid_view_widget.load_images(image_paths, self._tag_cache, self._input_dir_path())
         self.showMaximized()
         self.update_log(self.locale_manager.get_string("MainWindow", "Switched_To_Grid_View"), "blue")
 
@@ -1520,25 +1827,28 @@ class MainWindow(QMainWindow):
     def _show_overwrite_dialog(self, file_path: Path) -> bool:
         """
         Called from a worker thread to display an overwrite confirmation dialog in the GUI thread.
-        It safely blocks the worker thread and returns the user's response (True/False) using a signal and QEventLoop.
+        It blocks only the worker thread on a threading.Event until the GUI thread has answered; no nested event loop runs.
         """
         # This method is called from a non-GUI thread.
         # We need to wait for the result from the GUI thread.
-        
+        # closeEvent may already have set the event; clearing it now would block this thread forever.
+        if self._is_shutting_down:
+            return False
+
         self._overwrite_response = None
-        loop = QEventLoop()
-        self._overwrite_event_loop = loop
+        self._overwrite_reply_event.clear()
 
-        # Emit a signal to the main thread to show the dialog
+        # Emit a signal to the main thread to show the dialog (queued across threads)
         self.overwrite_dialog_requested.emit(file_path)
 
-        # Wait until the main thread signals that it's done.
-        loop.exec()
+        # Wait until the main thread signals that it's done (or the window is closing).
+        # The timeout covers a close that lands between the check above and clear().
+        while not self._overwrite_reply_event.wait(_OVERWRITE_WAIT_POLL):
+            if self._is_shutting_down:
+                self._overwrite_response = None
+                return False
 
         response = self._overwrite_response
-        
-        # Clean up
-        self._overwrite_event_loop = None
         self._overwrite_response = None
         
         return response if response is not None else False
@@ -1550,9 +1860,8 @@ class MainWindow(QMainWindow):
         response = self._ask_overwrite_confirmation(file_path)
         self._overwrite_response = response
         
-        # Quit the event loop to unblock the worker thread.
-        if self._overwrite_event_loop:
-            self._overwrite_event_loop.quit()
+        # Unblock the worker thread.
+        self._overwrite_reply_event.set()
 
     def _ask_overwrite_confirmation(self, file_path: Path) -> bool:
         """Method that actually displays the dialog and asks for confirmation from the user. Executed in the GUI thread."""
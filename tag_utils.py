@@ -1,5 +1,9 @@
 from pathlib import Path
+from typing import Sequence
 import csv
+import os
+import pickle
+import tempfile
 
 def get_txt_path(image_path: Path) -> Path:
     """Return the path to the txt file corresponding to the image path."""
@@ -19,14 +23,16 @@ def read_tags(txt_path: Path) -> list[str]:
         print(f"Error reading tag file {txt_path}: {e}")
         return []
 
-def write_tags(txt_path: Path, tags: list[str]):
-    """Write a list of tags to a txt file (overwriting existing content)."""
+def write_tags(txt_path: Path, tags: list[str]) -> bool:
+    """Write a list of tags to a txt file (overwriting existing content). Returns False if the write failed."""
     # Join tags with ", " as separator
     content = ', '.join(tags)
     try:
         txt_path.write_text(content, encoding='utf-8')
     except Exception as e:
         print(f"Error writing tag file {txt_path}: {e}")
+        return False
+    return True
 
 def add_tags_to_file(txt_path: Path, tags_to_add: list[str]) -> bool:
     """Add new tags to an existing tag file (avoiding duplicates)."""
@@ -132,10 +138,62 @@ def load_tag_translation_map(
                         # データがない場合は英語タグをそのまま使用
                         trans_list.append(en_tag)
                 mapping[en_tag] = trans_list
+
+        # タグファイルにはアンダースコア表記（long_hair）のままのタグもあるため、その表記もキーに加える。
+        # 表示時の検索は正規化なしの1回の辞書参照で済む（翻訳リストは共有）。
+        for en_tag, trans_list in list(mapping.items()):
+            if ' ' in en_tag:
+                mapping.setdefault(en_tag.replace(' ', '_'), trans_list)
                     
     except Exception as e:
         print(f"Error loading tag translations: {e}")
         import traceback
         traceback.print_exc()
         
-    return mapping
\ No newline at end of file
+    return mapping
+
+
+# Bump when the pickled layout of the translation map changes
+_TRANSLATION_CACHE_VERSION = 2
+
+def _csv_signature(csv_paths: Sequence[Path]) -> tuple[tuple[int, int], ...] | None:
+    """(mtime_ns, size) of each CSV, or None if any is missing."""
+    try:
+        return tuple((st.st_mtime_ns, st.st_size) for st in (os.stat(p) for p in csv_paths))
+    except OSError:
+        return None
+
+def load_tag_translation_map_cached(csv_paths: Sequence[Path], cache_path: Path) -> dict[str, list[str]]:
+    """
+    load_tag_translation_map() backed by a pickle cache. The cache is used only while every
+    CSV still has the mtime and size it was built from; otherwise the CSVs are parsed again
+    and the cache rewritten.
+    """
+    signature = _csv_signature(csv_paths)
+    if signature is None:
+        return load_tag_translation_map(*csv_paths)
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get("version") == _TRANSLATION_CACHE_VERSION and cached.get("signature") == signature:
+            return cached["map"]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Ignoring unreadable tag translation cache {cache_path}: {e}")
+
+    mapping = load_tag_translation_map(*csv_paths)
+    if mapping:
+        payload = {"version": _TRANSLATION_CACHE_VERSION, "signature": signature, "map": mapping}
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            print(f"Error writing tag translation cache {cache_path}: {e}")
+    return mapping
@@ -3,7 +3,6 @@ from __future__ import annotations
 import sys
 import csv
 import json
-import configparser
 import traceback
 import os
 from pathlib import Path
@@ -29,12 +28,9 @@ else:
         Image = None
         ort = None
 
-BASE_DIR = Path(sys.executable).parent if getattr(sys, 'frozen', False) else Path(__file__).parent
-LOG_FILE_PATH = BASE_DIR / "debug_log.txt"
-CONFIG_PATH = BASE_DIR / "config.ini"
-
+from constants import BASE_DIR, CONFIG_PATH
 from utils import log_dbg, GetString
-from app_settings import AppSettings, load_settings
+from app_settings import AppSettings, load_config, load_settings
 
 
 _get_string: GetString = lambda section, key, **kwargs: str(key)
@@ -474,8 +470,7 @@ def main(overwrite_checker: Callable[[Path], bool] | None = None, log_gui: Calla
 
     try:
         assert CONFIG_PATH.is_file(), _get_string_internal("TaggerCore", "Config_File_NotFound", CONFIG_PATH=str(CONFIG_PATH))
-        config = configparser.ConfigParser()
-        config.read(CONFIG_PATH, encoding='utf-8')
+        config = load_config()
     except Exception as e:
         log_dbg(_get_string_internal("TaggerCore", "Fatal_Error_Config_Load_Failed", type_e_name=type(e).__name__, e=str(e)))
         core_log_gui(_get_string_internal("TaggerCore", "Fatal_Error_Config_Load_Failed_GUI"), "red")
@@ -58,7 +58,11 @@ class Ui_MainWindow(object):
 
     def _connect_signals(self, main_window: 'MainWindow'):
         """Connects all signals to their corresponding slots."""
-        main_window.image_list.itemClicked.connect(main_window.select_image_item)
+        # Fires for mouse clicks and TagListWidget's keyboard/wheel navigation alike.
+        main_window.image_list.currentItemChanged.connect(main_window._on_current_image_changed)
+        # A click on the already-current item changes nothing above but should still reload it
+        main_window.image_list.itemClicked.connect(main_window._on_image_item_clicked)
+        main_window.image_list.mouse_released.connect(main_window._on_image_list_mouse_released)  # type: ignore
         main_window.input_line.editingFinished.connect(main_window._on_input_path_changed)
         main_window.input_line.textChanged.connect(main_window._update_input_dir)  # type: ignore
         main_window.input_line.folder_dropped.connect(main_window._handle_folder_drop)  # type: ignore
@@ -349,6 +353,8 @@ class Ui_MainWindow(object):
         layout = QVBoxLayout(group)
         main_window.log_output = QTextEdit()
         main_window.log_output.setReadOnly(True)
+        # The document drops its oldest blocks itself once the limit is reached
+        main_window.log_output.document().setMaximumBlockCount(constants.MAX_LOG_LINES)
         main_window.log_output.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         layout.addWidget(main_window.log_output)
         main_window.log_output.setMinimumHeight(100)
@@ -4,12 +4,9 @@ from pathlib import Path
 from typing import Any, Protocol
 from datetime import datetime
 import hashlib
-import configparser
+import os
 
-# Get the base directory whether this module is compiled into an executable or not.
-BASE_DIR = Path(sys.executable).parent if getattr(sys, 'frozen', False) else Path(__file__).parent
-LOG_FILE_PATH = BASE_DIR / "debug_log.txt"
-CONFIG_PATH = BASE_DIR / "config.ini"
+from constants import CONFIG_PATH_STR, LOG_FILE_PATH_STR, IMAGE_EXTENSION_SET
 
 class GetString(Protocol):
     def __call__(self, section: str, key: str, **kwargs: Any) -> str: ...
@@ -24,9 +21,10 @@ class DebugSettings:
     def __init__(self):
         self.debug_log_enabled: bool = False
         try:
-            if CONFIG_PATH.is_file():
+            if os.path.isfile(CONFIG_PATH_STR):
+                import configparser  # deferred: only needed when config.ini exists
                 config = configparser.ConfigParser()
-                config.read(CONFIG_PATH, encoding='utf-8')
+                config.read(CONFIG_PATH_STR, encoding='utf-8')
                 self.debug_log_enabled = config.getboolean('Debug', 'debug_log', fallback=False)
         except Exception:
             self.debug_log_enabled = False
@@ -40,6 +38,10 @@ class DebugSettings:
 def get_debug_settings() -> DebugSettings:
     return DebugSettings.get_instance()
 
+def is_debug_log_enabled() -> bool:
+    """Cheap check for callers that want to skip building a log message when it would be discarded."""
+    return get_debug_settings().debug_log_enabled
+
 def nowtag() -> str:
     """Return the current time as a string in the format [YYYY-MM-DD HH:MM:SS]."""
     return datetime.now().strftime("[%Y-%m-%d %H:%M:%S] ")
@@ -54,7 +56,7 @@ def write_debug_log(message: str, get_string: GetString | None = None):
         
     lines = message.split('\n')
     try:
-        with open(LOG_FILE_PATH, 'a', encoding='utf-8') as f:
+        with open(LOG_FILE_PATH_STR, 'a', encoding='utf-8') as f:
             for line in lines:
                 if line.strip():
                     f.write(nowtag() + line.strip() + "\n")
@@ -65,6 +67,32 @@ def write_debug_log(message: str, get_string: GetString | None = None):
 def log_dbg(msg: str, get_string: GetString | None = None):
     write_debug_log(msg, get_string)
 
+def scan_image_entries(base_path: Path) -> list[tuple[str, Path]]:
+    """Recursively finds all image files under base_path as (relative path, path) pairs, sorted case-insensitively by relative path."""
+    # One os.scandir walk over the tree, instead of one rglob sweep per extension.
+    root = str(base_path)
+    prefix_len = len(os.path.join(root, ""))
+    found: list[str] = []
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSION_SET:
+                        found.append(entry.path)
+        except OSError:
+            continue
+    # Every path starts with root, so slicing is relative_to(); sorting plain strings is far cheaper than comparing Paths
+    entries = [(path[prefix_len:], path) for path in found]
+    entries.sort(key=lambda entry: entry[0].lower())
+    return [(relative_path, Path(path)) for relative_path, path in entries]
+
+def scan_image_paths(base_path: Path) -> list[Path]:
+    """Recursively finds all image files under base_path, sorted."""
+    return [path for _, path in scan_image_entries(base_path)]
+
 def calculate_sha256(file_path: Path, chunk_size: int = 8192) -> str:
     """Calculate the SHA256 hash of a file."""
     sha256 = hashlib.sha256()
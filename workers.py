@@ -1,18 +1,23 @@
+import os
 from pathlib import Path
-import requests
 import threading
 from typing import Callable
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 
-from PySide6.QtCore import QObject, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
 
-from utils import write_debug_log, calculate_sha256, GetString, default_get_string_fallback
+from utils import write_debug_log, calculate_sha256, scan_image_entries, GetString, default_get_string_fallback
 from constants import (
-    DOWNLOAD_URLS, MODEL_PATH, TAGS_CSV_PATH, MODEL_POINTER_PATH
+    DOWNLOAD_URLS, MODEL_PATH, TAGS_CSV_PATH, MODEL_POINTER_PATH,
+    TAG_TRANSLATION_CSV_PATHS, TAG_TRANSLATION_CACHE_PATH
 )
 from app_settings import AppSettings, update_model_verification_status
-from get_pointer_huggingface import get_model_info_from_pointer
-from tagging_core import setup_tagger_from_settings, process_image_loop, get_image_paths_recursive
+from get_pointer_huggingface import get_model_info_from_pointer_async
+from tag_utils import load_tag_translation_map_cached
+
+# Tag sidecar reads/writes are I/O bound, so a few threads per core keep the disk busy
+FILE_IO_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 class DownloaderWorker(QObject):
     """Downloads model files and verifies their integrity."""
@@ -40,6 +45,7 @@ class DownloaderWorker(QObject):
         """
         if self.is_stopped():
             return False
+        import requests  # deferred so startup doesn't load the HTTP stack; cached in sys.modules afterwards
 
         file_name = file_path.name
         # 期待される最終サイズ。モデルポインターから取得した値があればそれを使用。
@@ -183,7 +189,17 @@ class DownloaderWorker(QObject):
             self.download_finished.emit(False)
             return
 
-        expected_sha256, expected_size = get_model_info_from_pointer(model_pointer_url, self.get_string)
+        # Fetch in the background and wait in short slices so stop() isn't stuck behind the request timeout.
+        pointer_future = get_model_info_from_pointer_async(model_pointer_url, self.get_string)
+        while True:
+            try:
+                expected_sha256, expected_size = pointer_future.result(timeout=0.1)
+                break
+            except FutureTimeout:  # Not the builtin TimeoutError before Python 3.11
+                if self.is_stopped():
+                    pointer_future.cancel()
+                    self.download_finished.emit(False)
+                    return
         if not expected_sha256 or not expected_size:
             self.log_message.emit(self.get_string("Workers", "DownloaderWorker_Error_FailedToGetModelInfo"), "red")
             self.download_finished.emit(False)
@@ -247,6 +263,8 @@ class TaggerThreadWorker(QObject):
         write_debug_log(str(self.get_string("Workers", "TaggerThreadWorker_Tagging_Process_Start")), self.get_string)
         
         try:
+            # Deferred: tagging_core pulls in numpy, PIL and onnxruntime, which only tagging needs
+            from tagging_core import setup_tagger_from_settings, process_image_loop, get_image_paths_recursive
             tagger, settings_dict = setup_tagger_from_settings(self._settings, self.get_string)
             if not tagger or not settings_dict:
                 self.log_message.emit(self.get_string("Workers", "TaggerThreadWorker_Error_Tagger_Init_Failed"), "red")
@@ -298,6 +316,43 @@ class TaggerThreadWorker(QObject):
             self.finished.emit()
             write_debug_log(str(self.get_string("Workers", "TaggerThreadWorker_Thread_Exit")), self.get_string)
 
+class ImageScanSignals(QObject):
+    """Signals for ImageScanJob. Kept unparented so a running job never emits on a deleted window."""
+    batch_ready = Signal(int, object)  # (generation, sorted list[(relative path, Path)] slice)
+    finished = Signal(int, int)      # (generation, total image count)
+
+class ImageScanJob(QRunnable):
+    """Scans a folder for images on a QThreadPool thread and streams the sorted result in batches"""
+    BATCH_SIZE = 500
+
+    def __init__(self, folder: Path, generation: int, signals: ImageScanSignals):
+        super().__init__()
+        self.folder = folder
+        self.generation = generation
+        self.signals = signals
+
+    def run(self):
+        entries: list[tuple[str, Path]] = []
+        try:
+            entries = scan_image_entries(self.folder)
+            for start in range(0, len(entries), self.BATCH_SIZE):
+                self.signals.batch_ready.emit(self.generation, entries[start:start + self.BATCH_SIZE])
+        except Exception as e:
+            write_debug_log(f"Image scan of {self.folder} failed: {e}")
+        finally:
+            self.signals.finished.emit(self.generation, len(entries))
+
+class TranslationMapLoader(QObject):
+    """Worker to load the tag translation map off the GUI thread (from its cache when possible)"""
+    map_loaded = Signal(object)  # dict[str, list[str]]; object avoids a QVariantMap round-trip
+    finished = Signal()
+
+    def run(self):
+        try:
+            self.map_loaded.emit(load_tag_translation_map_cached(TAG_TRANSLATION_CSV_PATHS, TAG_TRANSLATION_CACHE_PATH))
+        finally:
+            self.finished.emit()
+
 class TagLoader(QObject):
     """Worker to asynchronously load tag files from an image folder"""
     log_message = Signal(str, str)
@@ -319,21 +374,30 @@ class TagLoader(QObject):
             write_debug_log(f"DEBUG: {type(self).__name__}.is_stopped() returning True.")
         return is_set
 
+    def _count_one(self, txt: Path) -> Counter[str]:
+        """Reads one sidecar and counts its tags; an unreadable file counts as empty."""
+        if self.is_stopped():
+            return Counter()
+        try:
+            with open(txt, "rb") as f:
+                text = f.read().decode("utf-8")
+        except Exception as e:
+            write_debug_log(str(self.get_string("Workers", "TagLoader_TXT_Load_Failed", txt_name=txt.name, e=e)), self.get_string)
+            return Counter()
+        return Counter(filter(None, map(str.strip, text.split(","))))
+
     def run(self):
         write_debug_log(str(self.get_string("Workers", "TagLoader_Start", folder=self.folder)), self.get_string)
         counter: Counter[str] = Counter()
         files = list(self.folder.rglob("*.txt"))
         try:
-            for txt in files:
-                if self.is_stopped():
-                    break
-                try:
-                    with open(txt, "r", encoding="utf-8") as f:
-                        tags = [t.strip() for t in f.read().split(",") if t.strip()]
-                        counter.update(tags)
-                except Exception as e:
-                    write_debug_log(str(self.get_string("Workers", "TagLoader_TXT_Load_Failed", txt_name=txt.name, e=e)), self.get_string)
-            
+            with ThreadPoolExecutor(max_workers=FILE_IO_MAX_WORKERS) as executor:
+                for file_counter in executor.map(self._count_one, files):
+                    if self.is_stopped():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+                    counter.update(file_counter)
+
             if not self.is_stopped():
                 all_tags: list[tuple[str, int]] = counter.most_common() 
                 self.tags_loaded.emit(all_tags)
@@ -384,6 +448,40 @@ class BulkTagWorker(QObject):
             self.log_message.emit(self.get_string("Workers", "BulkTagWorker_Error_File_Processing_Failed", txt_name=txt_file_path.name), "red")
         return False
 
+    def _delete_tag_from_file(self, txt_file_path: Path, tag_to_delete: str) -> int:
+        """Removes tag_to_delete from one file. Returns its original index (for undo) if removed, else -1."""
+        if self.is_stopped():
+            return -1
+        original_index = -1
+
+        def delete_callback(tags: list[str]) -> list[str]:
+            nonlocal original_index
+            try:
+                # Record original position before deletion
+                original_index = tags.index(tag_to_delete)
+            except ValueError:
+                return tags
+            return [t for t in tags if t != tag_to_delete]
+
+        try:
+            if self._process_tag_file(txt_file_path, delete_callback):
+                return original_index
+        except Exception as e:
+            write_debug_log(f"Error processing {txt_file_path}: {e}", self.get_string)
+        return -1
+
+    def _add_tags_to_file(self, txt_file_path: Path, new_tags_to_add: list[str], prepend: bool) -> bool:
+        """Adds the tags missing from one file at the start or end. Returns True if the file was modified."""
+        if self.is_stopped():
+            return False
+
+        def add_callback(existing_tags: list[str]) -> list[str]:
+            existing_set = set(existing_tags)
+            missing_tags = [tag for tag in new_tags_to_add if tag not in existing_set]
+            return missing_tags + existing_tags if prepend else existing_tags + missing_tags
+
+        return self._process_tag_file(txt_file_path, add_callback)
+
     @Slot(Path, str)
     def run_bulk_delete(self, input_dir: Path, tag_to_delete: str):
         write_debug_log(str(self.get_string("Workers", "BulkTagWorker_Bulk_Delete_Start", tag_to_delete=tag_to_delete)), self.get_string)
@@ -391,26 +489,17 @@ class BulkTagWorker(QObject):
         file_tag_positions: list[tuple[Path, int]] = []
         
         try:
-            for txt in input_dir.rglob("*.txt"):
-                if self.is_stopped():
-                    break
-                
-                # Record original position before deletion
-                try:
-                    with open(txt, "r", encoding="utf-8") as f:
-                        existing_tags = [t.strip() for t in f.read().split(',') if t.strip()]
-                    
-                    if tag_to_delete in existing_tags:
-                        original_index = existing_tags.index(tag_to_delete)
-                        
-                        def delete_callback(tags: list[str]) -> list[str]:
-                            return [t for t in tags if t != tag_to_delete]
-
-                        if self._process_tag_file(txt, delete_callback):
-                            file_tag_positions.append((txt, original_index))
-                            count += 1
-                except Exception as e:
-                    write_debug_log(f"Error processing {txt}: {e}", self.get_string)
+            files = list(input_dir.rglob("*.txt"))
+            # Files are independent, so their read-modify-write runs on a pool; results come back in file order
+            with ThreadPoolExecutor(max_workers=FILE_IO_MAX_WORKERS) as executor:
+                results = executor.map(lambda txt: self._delete_tag_from_file(txt, tag_to_delete), files)
+                for txt, original_index in zip(files, results):
+                    if self.is_stopped():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+                    if original_index != -1:
+                        file_tag_positions.append((txt, original_index))
+                        count += 1
             
             if not self.is_stopped():
                 self.log_message.emit(self.get_string("Workers", "BulkTagWorker_Bulk_Delete_Complete", count=count, tag_to_delete=tag_to_delete), "green")
@@ -437,19 +526,16 @@ class BulkTagWorker(QObject):
             return
 
         try:
-            for txt in input_dir.rglob("*.txt"):
-                if self.is_stopped():
-                    break
-                
-                def add_callback(existing_tags: list[str]) -> list[str]:
-                    if prepend:
-                        return [tag for tag in new_tags_to_add if tag not in existing_tags] + existing_tags
-                    else:
-                        return existing_tags + [tag for tag in new_tags_to_add if tag not in existing_tags]
-
-                if self._process_tag_file(txt, add_callback):
-                    modified_files.append(txt)
-                    count += 1
+            files = list(input_dir.rglob("*.txt"))
+            with ThreadPoolExecutor(max_workers=FILE_IO_MAX_WORKERS) as executor:
+                results = executor.map(lambda txt: self._add_tags_to_file(txt, new_tags_to_add, prepend), files)
+                for txt, modified in zip(files, results):
+                    if self.is_stopped():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
+                    if modified:
+                        modified_files.append(txt)
+                        count += 1
 
             if not self.is_stopped():
                 self.log_message.emit(self.get_string("Workers", "BulkTagWorker_Bulk_Add_Complete", count=count, tags_to_add=tags_to_add), "green")